@@ -2,32 +2,61 @@
 Implements command-line commands and user interaction.
 """
 
+import functools
+import heapq
 import json
 import os
 import sys
 import tempfile
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from datetime import datetime
 
 import click
+import msgpack
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 from amtt.core.device import Device, DeviceConnectionError, DeviceManager
 from amtt.core.filesystem import FileInfo, FileSystemError, FileType
 from amtt.core.transfer import OrganizationStrategy, TransferProgress, TransferResult
-from amtt.core.batch import BatchConfig
-from amtt.core.transfer_log import TransferLogger
+from amtt.core.transfer import format_size as _format_size
+
+# rich.progress, BatchConfig and TransferLogger are imported inside the
+# commands that use them to keep CLI startup fast
+if TYPE_CHECKING:
+    from amtt.core.transfer_log import TransferLogEntry
 
 # Global state
 current_device: Device | None = None
-DEVICE_INFO_FILE = os.path.join(tempfile.gettempdir(), "amtt_device.json")
+
+# Parsed device info, keyed by the mtime of the device info file
+_device_info_cache: tuple[int, dict] | None = None
 
 # Rich console for pretty output
 console = Console()
 
+# Minimum seconds between progress bar refreshes during transfers
+PROGRESS_REFRESH_INTERVAL = 0.1
+
+# Number of files transferred concurrently in a batch transfer
+BATCH_TRANSFER_WORKERS = 4
+
+# Tables with more rows than this are printed as plain text instead of Rich
+PLAIN_TABLE_ROWS = 1000
+
+@functools.cache
+def _device_info_path() -> str:
+    """Path of the file that remembers the connected device"""
+    # Resolved on first use, since tempfile.gettempdir() probes the filesystem
+    return os.path.join(tempfile.gettempdir(), "amtt_device.mp")
+
+@functools.cache
+def _legacy_device_info_path() -> str:
+    """Path of the JSON device info file written by older versions"""
+    return os.path.join(tempfile.gettempdir(), "amtt_device.json")
+
 def save_device_info(device: Device):
     """Save device info to temporary file"""
     info = {
@@ -38,17 +67,73 @@ def save_device_info(device: Device):
             for s in device.storage_info
         ]
     }
-    with open(DEVICE_INFO_FILE, "w") as f:
-        json.dump(info, f)
+    _write_device_info(info)
 
-def load_device_info() -> Optional[dict]:
-    """Load device info from temporary file"""
+def _write_device_info(info: dict):
+    """
+    Atomically write device info
+
+    The data is written to a temporary file that then replaces the real one,
+    so an interrupted write never leaves a truncated file that would force a
+    full device rescan on the next command.
+    """
+    path = _device_info_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(msgpack.packb(info, use_bin_type=True))
+    os.replace(tmp_path, path)
+
+def _migrate_legacy_device_info() -> Optional[dict]:
+    """Convert a JSON device info file from older versions to msgpack"""
     try:
-        with open(DEVICE_INFO_FILE, "r") as f:
-            return json.load(f)
+        with open(_legacy_device_info_path(), "r") as f:
+            info = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
+    _write_device_info(info)
+    os.remove(_legacy_device_info_path())
+    return info
+
+def load_device_info() -> Optional[dict]:
+    """Load device info from temporary file
+
+    The parsed result is cached and reused for as long as the file's
+    modification time is unchanged.
+    """
+    global _device_info_cache
+
+    try:
+        mtime = os.stat(_device_info_path()).st_mtime_ns
+        if _device_info_cache is not None and _device_info_cache[0] == mtime:
+            return _device_info_cache[1]
+
+        with open(_device_info_path(), "rb") as f:
+            info = msgpack.unpackb(f.read(), raw=False)
+        _device_info_cache = (mtime, info)
+        return info
+    except FileNotFoundError:
+        try:
+            return _migrate_legacy_device_info()
+        except OSError:
+            return None
+    except (ValueError, msgpack.UnpackException):
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _find_connected_device(serial: str) -> Device:
+    """
+    Find a connected device by serial number
+
+    Successful lookups are memoized for the lifetime of the process so that
+    repeated calls (e.g. `pull` delegating to `transfer`) don't re-enumerate
+    USB devices.
+
+    Raises:
+        DeviceConnectionError: If no connected device has the given serial
+    """
+    return DeviceManager().find_device(serial)
+
 def get_current_device() -> Device:
     """Get current device or exit if not connected"""
     global current_device
@@ -58,14 +143,8 @@ def get_current_device() -> Device:
         info = load_device_info()
         if info:
             try:
-                device_manager = DeviceManager()
-                devices = device_manager.get_connected_devices()
-                
                 # Find the previously connected device
-                for device in devices:
-                    if device.serial == info["serial"]:
-                        current_device = device
-                        break
+                current_device = _find_connected_device(info["serial"])
             except Exception:
                 pass
     
@@ -76,13 +155,101 @@ def get_current_device() -> Device:
     return current_device
 
 
+@functools.lru_cache(maxsize=4096)
 def format_size(size: int) -> str:
     """Format size in bytes to human readable string"""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}" 
-        size /= 1024
-    return f"{size:.1f} PB"
+    return _format_size(size, sep=" ")
+
+
+# Formatted timestamps keyed by (year, month, day, hour, minute)
+_minute_format_cache: dict[tuple[int, int, int, int, int], str] = {}
+
+
+def format_minute(date: Optional[datetime]) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM', or '' if missing"""
+    if date is None:
+        return ""
+    # Files in camera folders often share a minute, so cache by minute
+    key = (date.year, date.month, date.day, date.hour, date.minute)
+    formatted = _minute_format_cache.get(key)
+    if formatted is None:
+        formatted = date.strftime("%Y-%m-%d %H:%M")
+        _minute_format_cache[key] = formatted
+    return formatted
+
+
+def _format_log_time(timestamp: str) -> str:
+    """Extract 'HH:MM:SS' from an ISO-8601 timestamp"""
+    if len(timestamp) >= 19 and timestamp[10] == "T":
+        return timestamp[11:19]
+    return datetime.fromisoformat(timestamp).strftime("%H:%M:%S")
+
+
+def _format_log_status(entry: "TransferLogEntry") -> str:
+    """Summarize how many files of a logged transfer succeeded"""
+    succeeded = len(entry.successful_files)
+    total_files = succeeded + len(entry.failed_files)
+    if total_files == 0:
+        return "No files"
+    return f"{succeeded}/{total_files} ({succeeded / total_files * 100:.1f}%)"
+
+
+class _RefreshThrottle:
+    """Limits progress bar redraws to one per PROGRESS_REFRESH_INTERVAL"""
+
+    def __init__(self, interval: float = PROGRESS_REFRESH_INTERVAL):
+        self._interval = interval
+        self._last_refresh = 0.0
+
+    def ready(self) -> bool:
+        """Return True, and start a new interval, if a redraw is due"""
+        now = time.monotonic()
+        if now - self._last_refresh < self._interval:
+            return False
+        self._last_refresh = now
+        return True
+
+
+def _print_file_list(header: str, marker: str, files: list[str]):
+    """Print a header followed by one marked line per file in a single write"""
+    lines = "\n".join(f"  {marker} {file}" for file in files)
+    # Skip Rich's highlighter, which would otherwise scan every path
+    console.print(f"\n{header}\n{lines}", highlight=False)
+
+
+def _print_table(table: Table, rows: list[tuple[str, ...]]):
+    """
+    Print rows through a Rich table, or as plain lines when not on a terminal
+
+    Piped output skips Rich entirely and gets one tab-separated line per row.
+    On a terminal, tables taller than the screen are shown through the pager,
+    and very large tables are paged as plain lines since laying out that many
+    rows with Rich is slow.
+
+    Args:
+        table: Table with its columns already defined
+        rows: Cell values for each row
+    """
+    if not console.is_terminal:
+        if rows:
+            click.echo("\n".join(["\t".join(row) for row in rows]))
+        return
+
+    if len(rows) > PLAIN_TABLE_ROWS:
+        header = "\t".join(str(column.header) for column in table.columns)
+        click.echo_via_pager(
+            "\n".join([header, *("\t".join(row) for row in rows)])
+        )
+        return
+
+    for row in rows:
+        table.add_row(*row)
+
+    if len(rows) > console.height:
+        with console.pager(styles=True):
+            console.print(table)
+    else:
+        console.print(table)
 
 
 def format_progress(p: TransferProgress) -> str:
@@ -156,14 +323,13 @@ def connect(force: bool):
                 table.add_column("Serial", style="blue")
                 table.add_column("Storage", justify="right", style="magenta")
                 
-                for i, device in enumerate(devices, 1):
-                    total_storage = sum(s.capacity for s in device.storage_info)
-                    table.add_row(
-                        str(i),
-                        device.name,
-                        device.serial,
-                        format_size(total_storage)
-                    )
+                # Formatted total capacity of each device, computed once up front
+                total_storage = [
+                    format_size(sum(s.capacity for s in device.storage_info))
+                    for device in devices
+                ]
+                for i, (device, storage) in enumerate(zip(devices, total_storage), 1):
+                    table.add_row(str(i), device.name, device.serial, storage)
                 
                 console.print(table)
                 choice = click.prompt(
@@ -198,12 +364,43 @@ def connect(force: bool):
             sys.exit(1)
 
 
-@cli.command()
+# Icons shown by `list`, indexed by FileType value
+_TYPE_ICONS = ("📁", "🖼", "🎥", "🎵", "📄", "📎")
+
+# Sort keys for the --sort option of `list`
+_SORT_KEYS: dict[str, Callable[[FileInfo], Any]] = {
+    "name": lambda f: f.name.lower(),
+    "size": lambda f: f.size or 0,
+    "date": lambda f: f.modified_date or datetime.min,
+}
+
+
+def _sort_files(
+    files: list[FileInfo],
+    key: Callable[[FileInfo], Any],
+    reverse: bool,
+    limit: Optional[int] = None,
+) -> list[FileInfo]:
+    """
+    Sort files, keeping only the first `limit` entries if given
+
+    With a limit, a heap selection is used instead of sorting every file.
+    """
+    if limit is None:
+        return sorted(files, key=key, reverse=reverse)
+    if reverse:
+        return heapq.nlargest(limit, files, key=key)
+    return heapq.nsmallest(limit, files, key=key)
+
+
+@cli.command("list")
 @click.argument("path", type=str, default="/")
 @click.option('--sort', type=click.Choice(['name', 'size', 'date']), default='name',
               help='Sort files by name, size, or date')
 @click.option('--reverse', is_flag=True, help='Reverse sort order')
-def list(path: str, sort: str, reverse: bool):
+@click.option('--limit', type=click.IntRange(min=1), default=None,
+              help='Show only the first N folders and files after sorting')
+def list_cmd(path: str, sort: str, reverse: bool, limit: Optional[int]):
     """List files and folders on the device
     
     PATH is the directory to list (default: root directory '/')
@@ -214,34 +411,28 @@ def list(path: str, sort: str, reverse: bool):
     - List DCIM folder:          amtt list /DCIM
     - List by size:              amtt list /DCIM --sort size
     - List newest first:         amtt list /DCIM --sort date --reverse
+    - List 20 largest files:     amtt list /DCIM --sort size --reverse --limit 20
     """
     try:
         device = get_current_device()
         
+        # Group by type while the directory is being scanned
+        folders = []
+        media_files = []
+
         with console.status(f"[blue]Reading {path}...[/blue]"):
-            files = device.filesystem.list_files(path)
+            for f in device.filesystem.iter_files(path):
+                if f.type == FileType.FOLDER:
+                    folders.append(f)
+                else:
+                    media_files.append(f)
 
-        if not files:
+        if not folders and not media_files:
             console.print("[yellow]Directory is empty[/yellow]")
             return
 
-        # Group by type
-        folders = []
-        media_files = []
-
-        for f in files:
-            if f.type == FileType.FOLDER:
-                folders.append(f)
-            else:
-                media_files.append(f)
-
         # Sort function
-        def get_sort_key(f: FileInfo):
-            if sort == 'size':
-                return f.size or 0
-            elif sort == 'date':
-                return f.modified_date or datetime.min
-            return f.name.lower()
+        get_sort_key = _SORT_KEYS[sort]
 
         # Show folders first in a table
         if folders:
@@ -249,15 +440,12 @@ def list(path: str, sort: str, reverse: bool):
             table.add_column("Name", style="blue")
             table.add_column("Modified", style="green")
             
-            for f in sorted(folders, key=get_sort_key, reverse=reverse):
-                date_str = (
-                    f.modified_date.strftime("%Y-%m-%d %H:%M")
-                    if f.modified_date
-                    else ""
-                )
-                table.add_row(f"📁 {f.name}/", date_str)
-                
-            console.print(table)
+            folder_icon = _TYPE_ICONS[FileType.FOLDER]
+            rows = [
+                (f"{folder_icon} {f.name}/", format_minute(f.modified_date))
+                for f in _sort_files(folders, get_sort_key, reverse, limit)
+            ]
+            _print_table(table, rows)
 
         # Show files in a table
         if media_files:
@@ -267,40 +455,34 @@ def list(path: str, sort: str, reverse: bool):
             table.add_column("Size", justify="right")
             table.add_column("Modified")
             
-            type_icons = {
-                FileType.IMAGE: "🖼",
-                FileType.VIDEO: "🎥",
-                FileType.AUDIO: "🎵",
-                FileType.DOCUMENT: "📄",
-                FileType.OTHER: "📎",
-            }
-            
-            for f in sorted(media_files, key=get_sort_key, reverse=reverse):
-                icon = type_icons.get(f.type, "📄")
-                size_str = format_size(f.size) if f.size else "?"
-                date_str = (
-                    f.modified_date.strftime("%Y-%m-%d %H:%M")
-                    if f.modified_date
-                    else ""
+            rows = [
+                (
+                    _TYPE_ICONS[f.type],
+                    f.name,
+                    format_size(f.size) if f.size else "?",
+                    format_minute(f.modified_date),
                 )
-                table.add_row(icon, f.name, size_str, date_str)
-                
-            console.print(table)
+                for f in _sort_files(media_files, get_sort_key, reverse, limit)
+            ]
+            _print_table(table, rows)
 
     except Exception as e:
         console.print(f"[red]Failed to list files: {str(e)}[/red]")
         sys.exit(1)
 
 
+# Organization strategies for the --organize option
+_ORGANIZATION_STRATEGIES = {
+    "none": OrganizationStrategy.NONE,
+    "date": OrganizationStrategy.BY_DATE,
+    "type": OrganizationStrategy.BY_TYPE,
+    "both": OrganizationStrategy.BY_TYPE_AND_DATE,
+}
+
+
 def _get_organization_strategy(organize: str) -> OrganizationStrategy:
     """Convert organize option to OrganizationStrategy."""
-    strategy_map = {
-        "none": OrganizationStrategy.NONE,
-        "date": OrganizationStrategy.BY_DATE,
-        "type": OrganizationStrategy.BY_TYPE,
-        "both": OrganizationStrategy.BY_TYPE_AND_DATE,
-    }
-    return strategy_map[organize]
+    return _ORGANIZATION_STRATEGIES[organize]
 
 
 def _handle_transfer_result(result: TransferResult, file_info: FileInfo, verbose: bool):
@@ -325,16 +507,32 @@ def _handle_batch_transfer(
     duplicate: str,
     verbose: bool,
     verify: bool = False,
+    workers: int = BATCH_TRANSFER_WORKERS,
 ):
-    """Handle batch transfer of files."""
+    """Handle batch transfer of files.
+
+    Files are transferred concurrently by up to `workers` threads, which hides
+    per-file USB latency when pulling many small files. The directory is
+    streamed, with only a few transfers queued ahead of the workers, so large
+    directories are never held in memory as a whole.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
+
     with console.status("[blue]Finding files to transfer...[/blue]"):
-        files = device.filesystem.list_files(source)
+        total = device.filesystem.count_files(source)
         
-    if not files:
+    if not total:
         console.print("[yellow]No files match pattern[/yellow]")
         sys.exit(1)
 
-    console.print(f"\nFound {len(files)} files for transfer")
+    console.print(f"\nFound {total} files for transfer")
     if not click.confirm("Do you want to proceed?"):
         console.print("[yellow]Transfer cancelled[/yellow]")
         return
@@ -346,26 +544,65 @@ def _handle_batch_transfer(
         TaskProgressColumn(),
         console=console
     ) as progress:
-        task = progress.add_task("Transferring files...", total=len(files))
+        task = progress.add_task("Transferring files...", total=total)
         
-        for file in files:
-            progress.update(task, description=f"Transferring {file.name}")
-            result = device.transfer_manager.transfer_file(
-                file,
-                Path(destination),
-                organization=_get_organization_strategy(organize),
-                delete_source=delete_source,
-                duplicate_strategy=duplicate,
-                verify=verify
-            )
-            if result.success:
-                progress.advance(task)
-            else:
-                progress.stop()
-                console.print(f"[red]Failed to transfer {file.name}: {result.error}[/red]")
-                sys.exit(1)
-
-    console.print(f"[green]Successfully transferred {len(files)} files[/green]")
+        organization = _get_organization_strategy(organize)
+        destination_path = Path(destination)
+        files = device.filesystem.iter_files(source)
+        transferred = 0
+
+        with ThreadPoolExecutor(max_workers=min(workers, total)) as executor:
+            running = {}  # In-flight futures and the files they transfer
+
+            def submit(file: FileInfo):
+                future = executor.submit(
+                    device.transfer_manager.transfer_file,
+                    file,
+                    destination_path,
+                    organization=organization,
+                    delete_source=delete_source,
+                    duplicate_strategy=duplicate,
+                    verify=verify
+                )
+                running[future] = file
+
+            # Keep at most two transfers per worker in flight, topping up
+            # from the directory scan as transfers complete
+            for file in files:
+                submit(file)
+                if len(running) >= 2 * workers:
+                    break
+
+            # Refresh the bar at most every PROGRESS_REFRESH_INTERVAL seconds,
+            # accumulating completed files in between
+            throttle = _RefreshThrottle()
+            pending = 0
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file = running.pop(future)
+                    result = future.result()
+                    if not result.success:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        progress.stop()
+                        console.print(f"[red]Failed to transfer {file.name}: {result.error}[/red]")
+                        sys.exit(1)
+
+                    transferred += 1
+                    pending += 1
+                    if throttle.ready():
+                        progress.update(
+                            task, description=f"Transferred {file.name}", advance=pending
+                        )
+                        pending = 0
+
+                    next_file = next(files, None)
+                    if next_file is not None:
+                        submit(next_file)
+
+        progress.update(task, advance=pending)
+
+    console.print(f"[green]Successfully transferred {transferred} files[/green]")
 
 
 def _handle_single_transfer(
@@ -379,6 +616,14 @@ def _handle_single_transfer(
     verify: bool = False,
 ):
     """Handle single file transfer."""
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
+
     try:
         file_info = device.filesystem.get_file_info(source)
     except FileSystemError:
@@ -394,8 +639,20 @@ def _handle_single_transfer(
     ) as progress:
         task = progress.add_task(f"Transferring {file_info.name}...", total=100)
         
+        # Only redraw when the whole percentage changes, and at most every
+        # PROGRESS_REFRESH_INTERVAL seconds until the transfer completes
+        throttle = _RefreshThrottle()
+        last_percent = -1
+
         def update_progress(p: TransferProgress):
-            progress.update(task, completed=p.percentage)
+            nonlocal last_percent
+            percent = int(p.percentage)
+            if percent == last_percent:
+                return
+            if not throttle.ready() and percent < 100:
+                return
+            progress.update(task, completed=percent)
+            last_percent = percent
             
         result = device.transfer_manager.transfer_file(
             file_info,
@@ -438,8 +695,8 @@ def _handle_single_transfer(
 @click.option(
     "--batch-delay",
     type=click.FLOAT,
-    default=1.0,
-    help="Delay between batches in seconds (default: 1.0s)"
+    default=0.0,
+    help="Delay between batches in seconds (default: 0s)"
 )
 @click.option(
     "--keep-source",
@@ -470,6 +727,8 @@ def transfer(source: str, destination: str, all: bool, batch_size: int, batch_fi
     - Transfer all files and keep source:
       amtt transfer --all ~/Backup --keep-source
     """
+    from amtt.core.batch import BatchConfig
+
     try:
         device = get_current_device()
         
@@ -543,14 +802,6 @@ def transfer(source: str, destination: str, all: bool, batch_size: int, batch_fi
     except Exception as e:
         console.print(f"[red]Error: {str(e)}[/red]")
 
-def _format_size(size: int) -> str:
-    """Format size in bytes to human readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024:
-            return f"{size:.1f}{unit}"
-        size /= 1024
-    return f"{size:.1f}TB"
-
 
 @cli.command()
 @click.argument("device_path", type=str)
@@ -612,6 +863,7 @@ def push(local_path: str, device_path: str, verify: bool):
     - Push and verify:
       amtt push ~/Music/song.mp3 /Music/ --verify
     """
+    is_dir = Path(local_path).is_dir()
     transfer.callback(
         local_path,
         device_path,
@@ -620,7 +872,7 @@ def push(local_path: str, device_path: str, verify: bool):
         duplicate="rename",
         verbose=True,
         verify=verify,
-        batch=os.path.isdir(local_path),
+        batch=is_dir,
     )
 
 
@@ -629,8 +881,8 @@ def paths():
     """Manage configured device paths"""
     pass
 
-@paths.command()
-def list():
+@paths.command("list")
+def list_paths():
     """List configured paths for the current device"""
     try:
         device = get_current_device()
@@ -743,6 +995,8 @@ def logs(date: str = None, show_files: bool = False):
     - View logs with file details:
       amtt logs --show-files
     """
+    from amtt.core.transfer_log import TransferLogger
+
     logger = TransferLogger()
     
     # Get available dates if no date specified
@@ -769,52 +1023,43 @@ def logs(date: str = None, show_files: bool = False):
     table.add_column("Duration", style="cyan")
     
     # Add entries to table
-    for entry in entries:
-        # Parse timestamp
-        time = datetime.fromisoformat(entry.timestamp).strftime("%H:%M:%S")
-        
-        # Create status summary
-        total_files = len(entry.successful_files) + len(entry.failed_files)
-        if total_files == 0:
-            status = "No files"
-        else:
-            success_rate = len(entry.successful_files) / total_files * 100
-            status = f"{len(entry.successful_files)}/{total_files} ({success_rate:.1f}%)"
-        
-        # Format size
-        size = _format_size(entry.total_size) if entry.total_size > 0 else "0B"
-        
-        # Add row
-        table.add_row(
-            time,
+    rows = [
+        (
+            _format_log_time(entry.timestamp),
             entry.source_dir,
             entry.destination_dir,
-            status,
-            size,
-            f"{entry.duration:.1f}s"
+            _format_log_status(entry),
+            format_size(entry.total_size) if entry.total_size > 0 else "0 B",
+            f"{entry.duration:.1f}s",
         )
-        
-        # Show file details if requested
-        if show_files and (entry.successful_files or entry.failed_files or entry.failed_paths):
+        for entry in entries
+    ]
+
+    # Show file details if requested
+    if show_files:
+        for entry in entries:
+            if not (entry.successful_files or entry.failed_files or entry.failed_paths):
+                continue
+
             if entry.successful_files:
-                console.print("\n[green]Successfully transferred:[/green]")
-                for file in entry.successful_files:
-                    console.print(f"  ✓ {file}")
-                    
+                _print_file_list(
+                    "[green]Successfully transferred:[/green]",
+                    "✓",
+                    entry.successful_files,
+                )
             if entry.failed_files:
-                console.print("\n[red]Failed to transfer:[/red]")
-                for file in entry.failed_files:
-                    console.print(f"  ✗ {file}")
-                    
+                _print_file_list(
+                    "[red]Failed to transfer:[/red]", "✗", entry.failed_files
+                )
             if entry.failed_paths:
-                console.print("\n[red]Failed to access:[/red]")
-                for path in entry.failed_paths:
-                    console.print(f"  ✗ {path}")
+                _print_file_list(
+                    "[red]Failed to access:[/red]", "✗", entry.failed_paths
+                )
             
             console.print()  # Add blank line between entries
     
     # Display the table
-    console.print(table)
+    _print_table(table, rows)
 
 # Register command groups
 cli.add_command(paths)
@@ -10,5 +10,5 @@ class BatchConfig:
     # Maximum number of files in a single batch
     MAX_FILES_PER_BATCH = 50
     
-    # Delay between batches in seconds
-    BATCH_DELAY = 1.0 
\ No newline at end of file
+    # Delay between batches in seconds (0 to start the next batch immediately)
+    BATCH_DELAY = 0.0 
\ No newline at end of file
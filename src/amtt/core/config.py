@@ -3,13 +3,18 @@ Configuration management for Android Media Transfer Tool.
 Handles default paths, whitelists, and user preferences.
 """
 
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-import json
+import functools
 import os
+import re
+import sys
 from typing import Optional, List, Dict, Tuple
 
-@dataclass
+import orjson
+
+@dataclass(slots=True)
 class PathConfig:
     """Configuration for a specific path on the Android device"""
     path: str  # Path on the device
@@ -17,44 +22,93 @@ class PathConfig:
     enabled: bool = True  # Whether this path is enabled
     local_path: Optional[str] = None  # Default local path to save files
 
-@dataclass
+    def __post_init__(self):
+        # Configured paths are compared against and used as dict keys often;
+        # share one string object per distinct path
+        self.path = sys.intern(self.path)
+
+@dataclass(slots=True)
 class DeviceConfig:
     """Device-specific configuration"""
     friendly_name: str  # User-friendly name for the device
     model: str  # Device model
     paths: List[PathConfig]
     default_local_path: str = "~/Downloads"  # Default download location
+    # Index of paths by device path, kept in sync with paths
+    paths_by_key: Dict[str, PathConfig] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # A hand-edited config may list a path twice; the first entry wins,
+        # as it did when paths were searched in order
+        self.paths_by_key = {}
+        for p in self.paths:
+            self.paths_by_key.setdefault(p.path, p)
+
+# Safe paths that are known to contain media files
+SAFE_PATHS = (
+    "/Internal shared storage/DCIM/Camera",
+    "/Internal shared storage/DCIM/Screenshots",
+    "/Internal shared storage/Pictures",
+    "/Internal shared storage/Movies",
+    "/Internal shared storage/Music",
+    "/Internal shared storage/Recordings",
+    "/Internal shared storage/Download"
+)
+
+# Paths that should never be accessed
+RESTRICTED_PATHS = (
+    ".android",
+    "Android/data",
+    "Android/obb",
+    "Android/media",
+    ".system",
+    "system",
+    ".hidden",
+    ".cache",
+    "cache",
+    ".trash",
+    "lost.dir"
+)
+
+# Matches any restricted path fragment in a single scan
+_RESTRICTED_PATTERN = re.compile("|".join(map(re.escape, RESTRICTED_PATHS)))
+
+@functools.lru_cache(maxsize=4096)
+def _is_safe_path(path: str) -> bool:
+    """
+    Check if a path is safe to access
+
+    The safe and restricted path lists are constant, so results are cached
+    without any invalidation.
+    """
+    # Clean and normalize path
+    path = path.replace("\\", "/").strip()
+    if not path.startswith("/"):
+        path = "/" + path
+        
+    # Check if path is in restricted list
+    if _RESTRICTED_PATTERN.search(path):
+        return False
+        
+    # Check if any path component starts with a dot (hidden)
+    if "/." in path:
+        return False
+        
+    # Check if path is in safe list or is a subpath of a safe path
+    return path.startswith(SAFE_PATHS)
 
 class ConfigManager:
     """Manages AMTT configuration"""
     
-    # Safe paths that are known to contain media files
-    SAFE_PATHS = [
-        "/Internal shared storage/DCIM/Camera",
-        "/Internal shared storage/DCIM/Screenshots",
-        "/Internal shared storage/Pictures",
-        "/Internal shared storage/Movies",
-        "/Internal shared storage/Music",
-        "/Internal shared storage/Recordings",
-        "/Internal shared storage/Download"
-    ]
-
-    # Paths that should never be accessed
-    RESTRICTED_PATHS = [
-        ".android",
-        "Android/data",
-        "Android/obb",
-        "Android/media",
-        ".system",
-        "system",
-        ".hidden",
-        ".cache",
-        "cache",
-        ".trash",
-        "lost.dir"
-    ]
+    # Path lists live at module level so is_safe_path results can be cached
+    SAFE_PATHS = SAFE_PATHS
+    RESTRICTED_PATHS = RESTRICTED_PATHS
     
-    DEFAULT_PATHS = [
+    # Template paths for new devices. Each device gets its own copies since
+    # PathConfig is modified in place when a path is enabled or disabled.
+    DEFAULT_PATHS: Tuple[PathConfig, ...] = (
         PathConfig(
             path="/Internal shared storage/DCIM/Camera",
             description="Camera photos and videos"
@@ -74,14 +128,16 @@ class ConfigManager:
         PathConfig(
             path="/Internal shared storage/Recordings",
             description="Voice recordings"
-        )
-    ]
+        ),
+    )
 
     def __init__(self):
         """Initialize configuration manager"""
         self.config_dir = Path.home() / ".config" / "amtt"
         self.config_file = self.config_dir / "config.json"
         self.device_configs: Dict[str, DeviceConfig] = {}
+        self._dirty = False  # Whether there are changes not yet written
+        self._batch_depth = 0  # Nesting level of batch() blocks
         self._load_config()
 
     def _load_config(self):
@@ -93,8 +149,7 @@ class ConfigManager:
                 # Create default config
                 self._save_config()
             
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
+            data = orjson.loads(self.config_file.read_bytes())
                 
             # Load device configs
             for device_id, device_data in data.get("devices", {}).items():
@@ -117,7 +172,33 @@ class ConfigManager:
             self.device_configs = {}
 
     def _save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file, deferred until the end of batch()"""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._flush()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several configuration changes into a single write
+
+        Example:
+            with config_manager.batch():
+                config_manager.add_path(device_id, path1, "Photos")
+                config_manager.add_path(device_id, path2, "Videos")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
+
+    def _flush(self):
+        """Write configuration to file if it has unsaved changes"""
+        if not self._dirty:
+            return
         try:
             data = {
                 "devices": {
@@ -139,8 +220,22 @@ class ConfigManager:
                 }
             }
             
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=4)
+            # Write to a synced temporary file first so a crash never leaves
+            # a truncated config behind. The name is per process so that
+            # processes saving at the same time don't share it
+            tmp_file = self.config_file.with_name(
+                f"{self.config_file.name}.{os.getpid()}.tmp"
+            )
+            try:
+                with open(tmp_file, "wb") as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.config_file)
+            except OSError:
+                tmp_file.unlink(missing_ok=True)
+                raise
+            self._dirty = False
         except Exception as e:
             print(f"Warning: Failed to save config: {e}")
 
@@ -161,7 +256,7 @@ class ConfigManager:
             self.device_configs[device_id] = DeviceConfig(
                 friendly_name=friendly_name,
                 model=model,
-                paths=self.DEFAULT_PATHS.copy()
+                paths=[replace(p) for p in self.DEFAULT_PATHS]
             )
             self._save_config()
             
@@ -181,25 +276,7 @@ class ConfigManager:
     @classmethod
     def is_safe_path(cls, path: str) -> bool:
         """Check if a path is safe to access"""
-        # Clean and normalize path
-        path = path.replace("\\", "/").strip()
-        if not path.startswith("/"):
-            path = "/" + path
-            
-        # Check if path is in restricted list
-        if any(restricted in path for restricted in cls.RESTRICTED_PATHS):
-            return False
-            
-        # Check if path starts with a dot (hidden)
-        path_parts = path.split("/")
-        if any(part.startswith(".") for part in path_parts if part):
-            return False
-            
-        # Check if path is in safe list or is a subpath of a safe path
-        return any(
-            path.startswith(safe_path)
-            for safe_path in cls.SAFE_PATHS
-        )
+        return _is_safe_path(path)
 
     def add_path(self, device_id: str, path: str, description: str):
         """Add a new path to device configuration"""
@@ -211,36 +288,35 @@ class ConfigManager:
             
         if device_id in self.device_configs:
             config = self.device_configs[device_id]
-            if not any(p.path == path for p in config.paths):
-                config.paths.append(PathConfig(path=path, description=description))
-                self.update_device_config(device_id, config)
+            if path not in config.paths_by_key:
+                path_config = PathConfig(path=path, description=description)
+                config.paths.append(path_config)
+                config.paths_by_key[path] = path_config
+                self._save_config()
 
     def remove_path(self, device_id: str, path: str):
         """Remove a path from device configuration"""
         if device_id in self.device_configs:
             config = self.device_configs[device_id]
-            config.paths = [p for p in config.paths if p.path != path]
-            self.update_device_config(device_id, config)
+            if config.paths_by_key.pop(path, None) is not None:
+                config.paths = [p for p in config.paths if p.path != path]
+                self._save_config()
 
     def set_path_enabled(self, device_id: str, path: str, enabled: bool):
         """Enable or disable a path"""
         if device_id in self.device_configs:
-            config = self.device_configs[device_id]
-            for p in config.paths:
-                if p.path == path:
-                    p.enabled = enabled
-                    break
-            self.update_device_config(device_id, config)
+            path_config = self.device_configs[device_id].paths_by_key.get(path)
+            if path_config is not None:
+                path_config.enabled = enabled
+                self._save_config()
 
     def set_local_path(self, device_id: str, path: str, local_path: str):
         """Set local download path for a device path"""
         if device_id in self.device_configs:
-            config = self.device_configs[device_id]
-            for p in config.paths:
-                if p.path == path:
-                    p.local_path = local_path
-                    break
-            self.update_device_config(device_id, config)
+            path_config = self.device_configs[device_id].paths_by_key.get(path)
+            if path_config is not None:
+                path_config.local_path = local_path
+                self._save_config()
 
     def get_enabled_paths(self, device_id: str) -> List[PathConfig]:
         """Get list of enabled paths for a device"""
@@ -4,20 +4,23 @@ Handles MTP device detection and connection management.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Iterator
 import subprocess
 import json
 from pathlib import Path
 import os
 import re
-import glob
+import threading
+import time
 import urllib.parse
 
 from amtt.core.filesystem import FileSystem
 from amtt.core.transfer import TransferManager
-from amtt.core.config import ConfigManager, PathConfig
+from amtt.core.config import ConfigManager, DeviceConfig, PathConfig
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StorageInfo:
     """Information about a storage unit on the device"""
 
@@ -29,23 +32,27 @@ class StorageInfo:
 class Device:
     """Represents a connected Android device"""
 
-    def __init__(self, name: str, serial: str, storage_info: list[StorageInfo], mount_point: Path):
-        """Initialize device instance"""
+    def __init__(
+        self,
+        name: str,
+        serial: str,
+        storage_info: list[StorageInfo],
+        mount_point: Path,
+        config_manager_factory: Callable[[], ConfigManager] | None = None,
+    ):
+        """
+        Initialize device instance
+
+        Args:
+            config_manager_factory: Called on first use to get the
+                configuration manager, so devices can share one. A new
+                ConfigManager is created by default.
+        """
         self.name = name
         self.serial = serial
         self.storage_info = storage_info
         self.mount_point = mount_point
-        
-        # Initialize managers
-        self.filesystem = FileSystem(self)
-        self.transfer_manager = TransferManager(self, self.filesystem)
-        self.config_manager = ConfigManager()
-        
-        # Get device configuration
-        self.device_id, self.config = self.config_manager.get_device_config(
-            serial=self.serial,
-            model=self.name
-        )
+        self._config_manager_factory = config_manager_factory
         
         # Validate device information
         if not self.name or not self.serial:
@@ -53,6 +60,44 @@ class Device:
         if not self.storage_info:
             raise ValueError("Device must have at least one storage unit")
 
+    # Managers and configuration are created on first use, so detecting
+    # devices doesn't read the config file or set up transfers
+
+    @cached_property
+    def filesystem(self) -> FileSystem:
+        """Filesystem handler for the device"""
+        return FileSystem(self)
+
+    @cached_property
+    def transfer_manager(self) -> TransferManager:
+        """Transfer manager for the device"""
+        return TransferManager(self, self.filesystem)
+
+    @cached_property
+    def config_manager(self) -> ConfigManager:
+        """Configuration manager"""
+        if self._config_manager_factory is None:
+            return ConfigManager()
+        return self._config_manager_factory()
+
+    @cached_property
+    def _device_config(self) -> tuple[str, DeviceConfig]:
+        """Device ID and configuration"""
+        return self.config_manager.get_device_config(
+            serial=self.serial,
+            model=self.name
+        )
+
+    @property
+    def device_id(self) -> str:
+        """Configuration ID of the device"""
+        return self._device_config[0]
+
+    @property
+    def config(self) -> DeviceConfig:
+        """Device configuration"""
+        return self._device_config[1]
+
     @property
     def friendly_name(self) -> str:
         """Get user-friendly name for the device"""
@@ -62,7 +107,7 @@ class Device:
         """Set user-friendly name for the device"""
         self.config_manager.set_friendly_name(self.device_id, name)
         # Reload config
-        _, self.config = self.config_manager.get_device_config(
+        self._device_config = self.config_manager.get_device_config(
             serial=self.serial,
             model=self.name
         )
@@ -94,6 +139,32 @@ class DeviceConnectionError(Exception):
     pass
 
 
+def _run_detached(fn: Callable):
+    """
+    Call a function on a daemon thread
+
+    Unlike ThreadPoolExecutor workers, daemon threads aren't joined when the
+    interpreter exits, so a caller that stops waiting for the result doesn't
+    keep the process alive.
+
+    Returns:
+        Future: Future of the function's result
+    """
+    # Imported here to keep it off the CLI's import path
+    from concurrent.futures import Future
+
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
 class DeviceManager:
     """Manages MTP device connections and operations"""
 
@@ -105,12 +176,137 @@ class DeviceManager:
         "~/.gvfs",              # Old GVFS location
     ]
 
+    # Captures a mount name without its "mtp:" / "host=" prefixes
+    _NAME_PREFIX_PATTERN = re.compile(r"\s*(?:mtp:\s*)?(?:host=\s*)?(.*?)\s*$", re.DOTALL)
+
+    # A "Volume(N): name" line of `gio mount -l` and the lines below it, up to
+    # the next volume or blank line
+    _GIO_VOLUME_PATTERN = re.compile(
+        r"^[ \t]*Volume\(\d+\):(?P<name>.*)\n?"
+        r"(?P<body>(?:(?![ \t]*Volume\()[ \t]*\S.*(?:\n|$))*)",
+        re.MULTILINE,
+    )
+    # The MTP mount URL in a volume, e.g. "Mount(0): Mi 11 -> mtp://Xiaomi_6b38/"
+    _GIO_MOUNT_PATTERN = re.compile(r"^[ \t]*Mount\(\d+\):.* -> (mtp://.*?)\s*$", re.MULTILINE)
+    # A Type line marking a volume as MTP
+    _GIO_MTP_TYPE_PATTERN = re.compile(r"Type:.*MTP")
+
+    # Printed between the outputs of commands combined into one adb shell call
+    ADB_OUTPUT_SEPARATOR = "---AMTT---"
+
+    # Bytes per unit suffix in human-readable df sizes
+    SIZE_MULTIPLIERS = {
+        'K': 1024,
+        'M': 1024 * 1024,
+        'G': 1024 * 1024 * 1024,
+        'T': 1024 * 1024 * 1024 * 1024
+    }
+
+    # Seconds a device scan is reused before devices are probed again
+    SCAN_CACHE_TTL = 3.0
+    # Longer reuse while hot-plug events clear the cache. Still bounded, as
+    # MTP mounts can appear some time after the USB event that announced them
+    HOTPLUG_SCAN_CACHE_TTL = 60.0
+
     def __init__(self):
         """Initialize the device manager"""
         self._connected_devices: list[Device] = []
+        # Monotonic time of the last successful scan and the devices it found
+        self._scan_cache: tuple[float, list[Device]] | None = None
+        # pyudev observer clearing the scan cache on USB hot-plug, if running
+        self._hotplug_observer = None
+        self._hotplug_events = 0  # Number of hot-plug events seen
+
+        # Common mount point directories for this user
+        self._uid = os.getuid()
+        user = os.getenv("USER", "")
+        self._mount_bases = [
+            os.path.expanduser(mount_pattern.format(uid=self._uid, user=user))
+            for mount_pattern in self.COMMON_MOUNT_POINTS
+        ]
+        # Entries of the mount point directories, listed once per scan
+        self._mount_entries: list[str] | None = None
+        # Bumped when the listing is reset, so a probe left running by
+        # find_device can't store a listing from before the reset
+        self._mount_generation = 0
+        # Configuration manager shared by all devices, created on first use
+        self._config_manager: ConfigManager | None = None
+
+    def _get_config_manager(self) -> ConfigManager:
+        """Get the configuration manager shared by this manager's devices"""
+        if self._config_manager is None:
+            self._config_manager = ConfigManager()
+        return self._config_manager
+
+    def _watch_hotplug(self) -> bool:
+        """
+        Start clearing the scan cache on USB hot-plug events
+
+        Uses pyudev when it is installed. Without it, or if udev events can't
+        be received, scans are only cached for SCAN_CACHE_TTL seconds instead
+        of HOTPLUG_SCAN_CACHE_TTL.
+
+        Returns:
+            bool: True if hot-plug events are being watched
+        """
+        if self._hotplug_observer is not None:
+            return True
+
+        try:
+            import pyudev
+        except ImportError:
+            return False
+
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by("usb")
+            observer = pyudev.MonitorObserver(monitor, callback=self._on_hotplug)
+            observer.start()
+        except Exception:
+            return False
+
+        self._hotplug_observer = observer
+        return True
+
+    def _on_hotplug(self, udev_device):
+        """Drop the cached scan when a USB device is added or removed"""
+        self._hotplug_events += 1
+        self._scan_cache = None
+
+    def _get_adb_details(self, serial: str) -> tuple[str, str] | None:
+        """
+        Read the model and storage usage of an ADB device
+
+        Both are fetched with a single adb shell invocation, so each device
+        costs one adb round-trip.
+
+        Returns:
+            Model name and raw df output (empty if df failed), or None if the
+            device can't be queried
+        """
+        separator = self.ADB_OUTPUT_SEPARATOR
+        try:
+            output = subprocess.run(
+                [
+                    "adb", "-s", serial, "shell",
+                    f"getprop ro.product.model && echo {separator} && "
+                    "(df /storage/emulated/0 || true)"
+                ],
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout
+        except subprocess.CalledProcessError:
+            return None
+
+        model, _, df_output = output.partition(f"{separator}\n")
+        return model.strip(), df_output
 
     def _try_adb_devices(self) -> list[dict]:
         """Try to find devices using ADB if available"""
+        # Imported here to keep it off the CLI's import path
+        from concurrent.futures import ThreadPoolExecutor
+
         try:
             result = subprocess.run(
                 ["adb", "devices", "-l"],
@@ -119,35 +315,50 @@ class DeviceManager:
                 check=True
             )
             
-            devices = []
+            serials = []
             for line in result.stdout.splitlines()[1:]:  # Skip header line
                 if not line.strip():
                     continue
                     
                 parts = line.split()
                 if len(parts) >= 2 and parts[1] == "device":
-                    # Get device info using adb
-                    try:
-                        model = subprocess.run(
-                            ["adb", "-s", parts[0], "shell", "getprop", "ro.product.model"],
-                            capture_output=True,
-                            text=True,
-                            check=True
-                        ).stdout.strip()
-                        
-                        devices.append({
-                            "type": "adb",
-                            "name": model or "Android Device",
-                            "serial": parts[0],
-                            "transport": "adb"
-                        })
-                    except subprocess.CalledProcessError:
-                        continue
-                        
-            return devices
+                    serials.append(parts[0])
+
+            if not serials:
+                return []
+
+            # Query all devices at once rather than one adb round-trip after
+            # another
+            with ThreadPoolExecutor(max_workers=len(serials)) as executor:
+                details = list(executor.map(self._get_adb_details, serials))
+
+            return [
+                {
+                    "type": "adb",
+                    "name": detail[0] or "Android Device",
+                    "serial": serial,
+                    "transport": "adb",
+                    "df_output": detail[1]
+                }
+                for serial, detail in zip(serials, details)
+                if detail is not None
+            ]
         except (subprocess.CalledProcessError, FileNotFoundError):
             return []
 
+    def _clean_name(self, name: str, serial: str | None = None) -> str:
+        """
+        Clean up a device name taken from a mount
+
+        Strips "mtp:" and "host=" prefixes and surrounding whitespace. If a
+        serial is given, it is also removed from the name along with any
+        separators left at either end.
+        """
+        name = self._NAME_PREFIX_PATTERN.match(name).group(1)
+        if serial:
+            name = name.replace(serial, "").strip("_-: ")
+        return name
+
     def _try_gio_mount(self) -> list[dict]:
         """Try to find devices using gio mount"""
         try:
@@ -158,92 +369,73 @@ class DeviceManager:
                 check=True
             )
             
-            devices = []
-            current_device = {}
-            
-            for line in result.stdout.splitlines():
-                line = line.strip()
-                if not line:
-                    if current_device:
-                        devices.append(current_device)
-                        current_device = {}
+            valid_devices = []
+            for volume in self._GIO_VOLUME_PATTERN.finditer(result.stdout):
+                body = volume.group("body")
+                mount = self._GIO_MOUNT_PATTERN.search(body)
+                if mount is None or not self._GIO_MTP_TYPE_PATTERN.search(body):
                     continue
-                    
-                if line.startswith("Volume("):
-                    current_device = {}
-                    # Extract device name from Volume line
-                    # Example: "Volume(0): Mi 11 Lite 5G"
-                    name = line.split(":", 1)[1].strip()
-                    current_device["name"] = name
-                elif "Type:" in line and "MTP" in line:
-                    current_device["type"] = "mtp"
-                elif line.startswith("Mount(") and "mtp://" in line:
-                    # Extract mount point from line like "Mount(0): Mi 11 Lite 5G -> mtp://Xiaomi_Mi_11_Lite_5G_6b38b99f/"
-                    parts = line.split(" -> ")
-                    if len(parts) == 2:
-                        url = parts[1].strip()
-                        current_device["mount_point"] = url
-                        # Extract serial from URL
-                        serial = url.split("/")[-2]
-                        # Clean up serial number
-                        serial = serial.replace("mtp:host=", "")
-                        current_device["serial"] = serial
-                        current_device["transport"] = "mtp"
-                    
-            if current_device:
-                devices.append(current_device)
+
+                url = mount.group(1)
+                # Extract serial from URL
+                serial = url.split("/")[-2].replace("mtp:host=", "")
+                valid_devices.append({
+                    "type": "mtp",
+                    "name": self._clean_name(volume.group("name"), serial),
+                    "mount_point": url,
+                    "serial": serial,
+                    "transport": "mtp"
+                })
                 
-            # Filter out incomplete devices and clean up names
-            valid_devices = []
-            for device in devices:
-                if device.get("type") == "mtp" and "mount_point" in device:
-                    # Clean up device name
-                    name = device["name"]
-                    # Remove any "mtp:" prefix
-                    if name.startswith("mtp:"):
-                        name = name[4:].strip()
-                    # Remove any host= prefix
-                    if name.startswith("host="):
-                        name = name[5:].strip()
-                    # Remove any serial number from name
-                    if device["serial"] in name:
-                        name = name.replace(device["serial"], "").strip()
-                    # Remove any trailing separators
-                    name = name.rstrip("_-: ")
-                    device["name"] = name
-                    valid_devices.append(device)
-                    
             return valid_devices
         except (subprocess.CalledProcessError, FileNotFoundError):
             return []
 
+    def _get_mount_entries(self) -> list[str]:
+        """
+        List the entries of all common mount point directories
+
+        The listing is shared by the mount-point scan and the mount point
+        lookup of each device, and is refreshed with every device scan.
+        """
+        entries = self._mount_entries
+        if entries is None:
+            generation = self._mount_generation
+            entries = []
+            for mount_base in self._mount_bases:
+                try:
+                    with os.scandir(mount_base) as scan:
+                        entries.extend(
+                            entry.path
+                            for entry in scan
+                            if not entry.name.startswith(".")
+                        )
+                except OSError:
+                    continue
+            if generation == self._mount_generation:
+                self._mount_entries = entries
+        return entries
+
+    def _reset_mount_entries(self):
+        """List the mount point directories again on next use"""
+        self._mount_entries = None
+        self._mount_generation += 1
+
     def _try_find_mount_point(self) -> list[dict]:
         """Try to find devices by scanning common mount points"""
         devices = []
-        uid = os.getuid()
-        user = os.getenv("USER", "")
         
-        for mount_pattern in self.COMMON_MOUNT_POINTS:
-            mount_base = os.path.expanduser(
-                mount_pattern.format(uid=uid, user=user)
-            )
-            
-            # Look for MTP/Android mounts
-            for mount_point in glob.glob(f"{mount_base}/*"):
-                if any(x in mount_point.lower() for x in ["android", "mtp", "phone"]):
-                    name = os.path.basename(mount_point)
-                    # Clean up name
-                    if name.startswith("mtp:"):
-                        name = name[4:].strip()
-                    if name.startswith("host="):
-                        name = name[5:].strip()
-                    devices.append({
-                        "type": "mtp",
-                        "name": name,
-                        "mount_point": f"mtp://{name}/",
-                        "serial": name,
-                        "transport": "mtp"
-                    })
+        # Look for MTP/Android mounts
+        for mount_point in self._get_mount_entries():
+            if any(x in mount_point.lower() for x in ["android", "mtp", "phone"]):
+                name = self._clean_name(os.path.basename(mount_point))
+                devices.append({
+                    "type": "mtp",
+                    "name": name,
+                    "mount_point": f"mtp://{name}/",
+                    "serial": name,
+                    "transport": "mtp"
+                })
                     
         return devices
 
@@ -255,33 +447,24 @@ class DeviceManager:
             mount_dir.mkdir(parents=True, exist_ok=True)
             return mount_dir
             
-        # For MTP devices, try different methods to get mount point
-        methods = [
-            # Method 1: Use gio info
-            lambda: self._get_gio_mount_point(device_info["mount_point"]),
-            
-            # Method 2: Check common mount points
-            lambda: self._find_in_common_mount_points(device_info["serial"]),
-            
-            # Method 3: Use direct MTP path
-            lambda: Path(f"/run/user/{os.getuid()}/gvfs/mtp:host={device_info['serial']}")
-        ]
-        
-        for method in methods:
-            try:
-                mount_point = method()
-                if mount_point and (
-                    mount_point.exists() or 
-                    device_info["transport"] == "adb"
-                ):
-                    return mount_point
-            except Exception:
-                continue
+        # For MTP devices, use the first candidate that exists
+        for mount_point in self._iter_mount_point_candidates(device_info):
+            if mount_point is not None and os.path.exists(mount_point):
+                return mount_point
                 
         raise DeviceConnectionError(
             f"Could not find mount point for device: {device_info['name']}"
         )
 
+    def _iter_mount_point_candidates(self, device_info: dict) -> Iterator[Path | None]:
+        """Yield possible mount points of an MTP device, most reliable first"""
+        # Method 1: Use gio info
+        yield self._get_gio_mount_point(device_info["mount_point"])
+        # Method 2: Check common mount points
+        yield self._find_in_common_mount_points(device_info["serial"])
+        # Method 3: Use direct MTP path
+        yield Path(f"/run/user/{self._uid}/gvfs/mtp:host={device_info['serial']}")
+
     def _get_gio_mount_point(self, mtp_url: str) -> Path | None:
         """Get mount point using gio info"""
         try:
@@ -300,16 +483,9 @@ class DeviceManager:
 
     def _find_in_common_mount_points(self, device_id: str) -> Path | None:
         """Find device in common mount points"""
-        uid = os.getuid()
-        user = os.getenv("USER", "")
-        
-        for mount_pattern in self.COMMON_MOUNT_POINTS:
-            mount_base = os.path.expanduser(
-                mount_pattern.format(uid=uid, user=user)
-            )
-            
-            # Look for exact device ID match
-            for mount_point in glob.glob(f"{mount_base}/*{device_id}*"):
+        # Look for exact device ID match
+        for mount_point in self._get_mount_entries():
+            if device_id in os.path.basename(mount_point):
                 return Path(mount_point)
                 
         return None
@@ -330,28 +506,34 @@ class DeviceManager:
         # Get mount point
         mount_point = self._get_mount_point(device_info)
         
-        # Get storage info
+        # Get storage info, unless it was read along with the device details
         storage_info = []
+        output = device_info.get("df_output")
+        parse_size = self._parse_size
         try:
-            if device_info["transport"] == "adb":
+            if output is None and device_info["transport"] == "adb":
                 # Use adb to get storage info
-                result = subprocess.run(
+                output = subprocess.run(
                     ["adb", "-s", serial, "shell", "df", "/storage/emulated/0"],
                     capture_output=True,
                     text=True,
                     check=True
-                )
-            else:
-                # Use regular df for mounted devices
-                result = subprocess.run(
-                    ["df", "-h", str(mount_point)],
+                ).stdout
+            elif output is None:
+                # Use regular df for mounted devices, with sizes in bytes
+                output = subprocess.run(
+                    ["df", "-B1", str(mount_point)],
                     capture_output=True,
                     text=True,
                     check=True
-                )
-                
+                ).stdout
+                parse_size = self._parse_byte_count
+        except subprocess.CalledProcessError:
+            output = ""
+
+        if output:
             # Skip header line
-            lines = result.stdout.splitlines()[1:]
+            lines = output.splitlines()[1:]
             for line in lines:
                 parts = line.split()
                 if len(parts) >= 6:
@@ -360,10 +542,10 @@ class DeviceManager:
                         StorageInfo(
                             id=len(storage_info),
                             name=f"Storage {len(storage_info) + 1}",
-                            capacity=self._parse_size(total)
+                            capacity=parse_size(total)
                         )
                     )
-        except subprocess.CalledProcessError:
+        else:
             # Fallback to default storage
             storage_info = [StorageInfo(id=0, name="Device Storage", capacity=0)]
             
@@ -371,7 +553,8 @@ class DeviceManager:
             name=name,
             serial=serial,
             storage_info=storage_info,
-            mount_point=mount_point
+            mount_point=mount_point,
+            config_manager_factory=self._get_config_manager
         )
 
     def _parse_size(self, size_str: str) -> int:
@@ -379,17 +562,78 @@ class DeviceManager:
         try:
             size = float(size_str[:-1])
             unit = size_str[-1].upper()
-            multipliers = {
-                'K': 1024,
-                'M': 1024 * 1024,
-                'G': 1024 * 1024 * 1024,
-                'T': 1024 * 1024 * 1024 * 1024
-            }
-            return int(size * multipliers.get(unit, 1))
+            return int(size * self.SIZE_MULTIPLIERS.get(unit, 1))
         except (ValueError, IndexError):
             return 0
 
-    def get_connected_devices(self) -> list[Device]:
+    def _parse_byte_count(self, size_str: str) -> int:
+        """Convert a df -B1 size column to bytes ('-' when unknown)"""
+        try:
+            return int(size_str)
+        except ValueError:
+            return 0
+
+    def _get_probes(self) -> tuple:
+        """Device detection methods, in order of preference"""
+        return (
+            self._try_adb_devices,
+            self._try_gio_mount,
+            self._try_find_mount_point,
+        )
+
+    def _get_cached_scan(self) -> list[Device] | None:
+        """Get the devices found by the last scan, if it is still fresh"""
+        if self._scan_cache is None:
+            return None
+        scanned_at, devices = self._scan_cache
+        if self._hotplug_observer is not None:
+            ttl = self.HOTPLUG_SCAN_CACHE_TTL
+        else:
+            ttl = self.SCAN_CACHE_TTL
+        if time.monotonic() - scanned_at < ttl:
+            return devices
+        return None
+
+    def find_device(self, serial: str) -> Device:
+        """
+        Find a connected device by serial number
+
+        Unlike get_connected_devices, this only initializes the one device,
+        and returns as soon as the device is reported by a detection method
+        once every method preferred over it has finished without reporting
+        it. The same device is then picked, under the same name, as when
+        connecting.
+
+        Args:
+            serial: Serial number of the device
+
+        Returns:
+            Device: The connected device
+
+        Raises:
+            DeviceConnectionError: If no connected device has the serial
+        """
+        devices = self._get_cached_scan()
+        if devices is not None:
+            for device in devices:
+                if device.serial == serial:
+                    return device
+            raise DeviceConnectionError(f"Device {serial} is no longer connected")
+
+        self._reset_mount_entries()
+        # Probes run on daemon threads, so neither this method nor the
+        # process exit waits for the slower ones once the device is found
+        futures = [_run_detached(probe) for probe in self._get_probes()]
+        # Take results in order of preference, as get_connected_devices
+        # does when removing duplicates
+        for future in futures:
+            for device_info in future.result():
+                if device_info["serial"] == serial:
+                    return self._create_device(device_info)
+
+        raise DeviceConnectionError(f"Device {serial} is no longer connected")
+
+    def get_connected_devices(self, force: bool = False) -> list[Device]:
         """
         Detect and return list of connected Android devices.
         Tries multiple methods to find devices:
@@ -397,36 +641,54 @@ class DeviceManager:
         2. GIO/GVFS MTP mounts
         3. Common mount points scan
 
+        Results are reused for SCAN_CACHE_TTL seconds, or when pyudev is
+        available, until a USB device is plugged in or removed or for at most
+        HOTPLUG_SCAN_CACHE_TTL seconds.
+
+        Args:
+            force: Scan again even if a recent scan result is available
+
         Returns:
             List[Device]: List of connected devices
 
         Raises:
             DeviceConnectionError: If no devices found or connection fails
         """
+        if not force:
+            devices = self._get_cached_scan()
+            if devices is not None:
+                return devices
+
+        # Events arriving during the scan make its result stale
+        self._watch_hotplug()
+        hotplug_events = self._hotplug_events
+        self._reset_mount_entries()
+
+        # Imported here to keep it off the CLI's import path
+        from concurrent.futures import ThreadPoolExecutor
+
         try:
             devices = []
             
-            # Try all detection methods
-            device_infos = (
-                self._try_adb_devices() +
-                self._try_gio_mount() +
-                self._try_find_mount_point()
-            )
+            # Try all detection methods at once; each mostly waits on a
+            # subprocess or the filesystem, so this costs the slowest probe
+            # rather than the sum of all three
+            probes = self._get_probes()
+            with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+                results = [executor.submit(probe) for probe in probes]
+                device_infos = [
+                    info for result in results for info in result.result()
+                ]
             
-            # Remove duplicates based on serial number
-            seen_serials = set()
-            unique_devices = []
-            for device in device_infos:
-                serial = device["serial"]
-                # Clean up serial
-                if serial.startswith("mtp:host="):
-                    serial = serial[9:]
-                if serial not in seen_serials:
-                    seen_serials.add(serial)
-                    unique_devices.append(device)
+            # Remove duplicates based on serial number, keeping the first
+            # probe's entry. Serials are already stripped of "mtp:host="
+            # prefixes by the probes.
+            unique_devices = {}
+            for device_info in device_infos:
+                unique_devices.setdefault(device_info["serial"], device_info)
             
             # Create device instances
-            for device_info in unique_devices:
+            for device_info in unique_devices.values():
                 try:
                     devices.append(self._create_device(device_info))
                 except Exception as e:
@@ -443,6 +705,8 @@ class DeviceManager:
                 )
 
             self._connected_devices = devices
+            if self._hotplug_events == hotplug_events:
+                self._scan_cache = (time.monotonic(), devices)
             return devices
         except Exception as e:
             raise DeviceConnectionError(f"Failed to connect to device: {str(e)}") from e
@@ -460,3 +724,4 @@ class DeviceManager:
                     pass
                     
         self._connected_devices = []
+        self._scan_cache = None
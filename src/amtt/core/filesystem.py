@@ -3,29 +3,32 @@ Filesystem operations for Android Media Transfer Tool.
 """
 
 import os
-import shutil
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum, auto
-from pathlib import Path
-import mimetypes
-from typing import List, Optional
+from enum import IntEnum
+from stat import S_ISDIR
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from amtt.core.config import ConfigManager
 
 
-class FileType(Enum):
-    """Types of files supported by the tool"""
+class FileType(IntEnum):
+    """Types of files supported by the tool
 
-    FOLDER = auto()
-    IMAGE = auto()    # jpg, png, gif, etc.
-    VIDEO = auto()    # mp4, mov, etc.
-    AUDIO = auto()    # mp3, wav, etc.
-    DOCUMENT = auto()
-    OTHER = auto()    # unsupported types
+    Values are contiguous from 0 so they can index per-type lookup tuples.
+    """
 
+    FOLDER = 0
+    IMAGE = 1     # jpg, png, gif, etc.
+    VIDEO = 2     # mp4, mov, etc.
+    AUDIO = 3     # mp3, wav, etc.
+    DOCUMENT = 4
+    OTHER = 5     # unsupported types
 
-@dataclass
+
+@dataclass(slots=True)
 class FileInfo:
     """Information about a file or directory"""
 
@@ -65,6 +68,16 @@ class FileSystem:
         }
     }
 
+    # File type of each supported extension, for single-lookup detection
+    EXTENSION_TYPES = {
+        ext: file_type
+        for file_type, extensions in SUPPORTED_EXTENSIONS.items()
+        for ext in extensions
+    }
+
+    # Maximum number of directory listings kept in memory
+    LISTING_CACHE_SIZE = 128
+
     def __init__(self, device):
         """
         Initialize filesystem handler
@@ -75,27 +88,116 @@ class FileSystem:
         self.device = device
         self.mount_point = device.mount_point
 
+        # Recently listed directories, least recently used first. Each entry
+        # holds the directory's (mtime, size) stamp at listing time and a
+        # mapping of entry names to their FileInfo.
+        self._listing_cache: OrderedDict[
+            str, Tuple[Tuple[int, int], Dict[str, FileInfo]]
+        ] = OrderedDict()
+        # Guards the listing cache, which the async methods use from threads
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(path: str) -> str:
+        """Listing cache key for a directory path"""
+        return path.rstrip("/") or "/"
+
+    def _get_stamp(self, path: str) -> Optional[Tuple[int, int]]:
+        """
+        Get the (mtime in ns, size) stamp of a path, or None if unreadable
+
+        The size catches changes that fall within the coarse mtime
+        resolution of FAT-formatted and FUSE-mounted storage.
+        """
+        try:
+            stat = os.stat(os.path.join(self.mount_point, path.lstrip("/")))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_cached_listing(
+        self, path: str, stamp: Optional[Tuple[int, int]] = None
+    ) -> Optional[Dict[str, FileInfo]]:
+        """
+        Get the cached listing of a directory, if it is still current
+
+        A listing is dropped once the directory's mtime or size differs from
+        the one recorded when it was listed, i.e. after entries were added, removed
+        or renamed by anything other than this FileSystem.
+
+        Args:
+            path: Directory path
+            stamp: Current stamp of the directory, if already known
+        """
+        key = self._cache_key(path)
+        with self._cache_lock:
+            cached = self._listing_cache.get(key)
+        if cached is None:
+            return None
+
+        if stamp is None:
+            stamp = self._get_stamp(path)
+        with self._cache_lock:
+            if cached[0] != stamp:
+                self._listing_cache.pop(key, None)
+                return None
+            if key in self._listing_cache:
+                self._listing_cache.move_to_end(key)
+        return cached[1]
+
+    def _cache_listing(
+        self, path: str, files: List[FileInfo], stamp: Tuple[int, int]
+    ):
+        """Store a directory listing, evicting the least recently used one"""
+        listing = {f.name: f for f in files}
+        with self._cache_lock:
+            self._listing_cache[self._cache_key(path)] = (stamp, listing)
+            if len(self._listing_cache) > self.LISTING_CACHE_SIZE:
+                self._listing_cache.popitem(last=False)
+
+    def invalidate_cache(self, path: str):
+        """
+        Drop cached listings affected by a change to a path
+
+        Both the listing of the path itself and the listing of its parent
+        directory are removed.
+
+        Args:
+            path: File or directory that was created, changed or deleted
+        """
+        path = path.rstrip("/")
+        targets = {path.strip("/"), os.path.dirname(path).strip("/")}
+        with self._cache_lock:
+            for key in [k for k in self._listing_cache if k.strip("/") in targets]:
+                del self._listing_cache[key]
+
+    @staticmethod
+    def _get_extension(path: str) -> str:
+        """
+        Get the lowercased extension of a path's final component
+
+        Equivalent to os.path.splitext for media file names, but cheaper
+        since it is called for every directory entry.
+        """
+        name = path[path.rfind("/") + 1:]
+        dot = name.rfind(".")
+        return name[dot:].lower() if dot > 0 else ""
+
     def _is_media_file(self, path: str) -> bool:
         """Check if file is a supported media type"""
-        ext = os.path.splitext(path)[1].lower()
-        return any(
-            ext in extensions
-            for extensions in self.SUPPORTED_EXTENSIONS.values()
-        )
-
-    def _get_file_type(self, path: str) -> FileType:
-        """Determine file type from extension"""
-        if os.path.isdir(path):
+        return self._get_extension(path) in self.EXTENSION_TYPES
+
+    def _get_file_type(self, entry: os.DirEntry) -> FileType:
+        """
+        Determine the file type of a directory entry from its extension
+
+        The folder check uses the type scandir already reported for the
+        entry, so it normally needs no extra stat call.
+        """
+        if entry.is_dir():
             return FileType.FOLDER
             
-        ext = os.path.splitext(path)[1].lower()
-        
-        # Check each type's extensions
-        for file_type, extensions in self.SUPPORTED_EXTENSIONS.items():
-            if ext in extensions:
-                return file_type
-                
-        return FileType.OTHER
+        return self.EXTENSION_TYPES.get(self._get_extension(entry.name), FileType.OTHER)
 
     def _verify_path_safety(self, path: str):
         """Verify that a path is safe to access"""
@@ -105,22 +207,44 @@ class FileSystem:
                 "Please use only media directories."
             )
 
-    def list_files(self, path: str) -> List[FileInfo]:
+    def iter_files(self, path: str) -> Iterator[FileInfo]:
         """
-        List files in a directory
-        
+        Iterate over files in a directory
+
+        Unlike list_files, entries are yielded while the directory is being
+        scanned, so callers can start processing before the scan completes.
+        The path is validated before this method returns. Directories in the
+        listing cache are served from it.
+
         Args:
             path: Directory path to list
-            
+
         Returns:
-            List of FileInfo objects for files and subdirectories
-            
+            Iterator of FileInfo objects for files and subdirectories
+
         Raises:
             FileSystemError: If path is invalid or inaccessible
         """
+        return self._iter_files(path, cache=False)
+
+    def _iter_files(self, path: str, cache: bool) -> Iterator[FileInfo]:
+        """
+        Iterate over files in a directory, serving cached listings
+
+        Args:
+            path: Directory path to list
+            cache: Whether to cache the listing once it has been fully read
+        """
         try:
             # Verify path safety
             self._verify_path_safety(path)
+
+            # Read the stamp before scanning, so changes made during the scan
+            # invalidate the listing
+            stamp = self._get_stamp(path)
+            listing = self._get_cached_listing(path, stamp)
+            if listing is not None:
+                return iter(listing.values())
             
             # Get absolute path
             abs_path = os.path.join(self.mount_point, path.lstrip("/"))
@@ -128,40 +252,112 @@ class FileSystem:
                 raise FileSystemError(f"Path does not exist: {path}")
             if not os.path.isdir(abs_path):
                 raise FileSystemError(f"Path is not a directory: {path}")
-                
-            files = []
-            for entry in os.scandir(abs_path):
-                try:
-                    # Skip hidden files and system directories
-                    if entry.name.startswith("."):
-                        continue
-                        
-                    file_type = self._get_file_type(entry.path)
-                    
-                    # For files (not folders), only include media files
-                    if file_type != FileType.FOLDER and file_type == FileType.OTHER:
-                        continue
+
+            entries = os.scandir(abs_path)
+        except Exception as e:
+            raise FileSystemError(f"Failed to list files: {str(e)}")
+
+        files = self._iter_entries(entries, path)
+        if cache and stamp is not None:
+            files = self._cache_when_complete(files, path, stamp)
+        return files
+
+    def _cache_when_complete(
+        self, files: Iterator[FileInfo], path: str, stamp: Tuple[int, int]
+    ) -> Iterator[FileInfo]:
+        """Pass files through, caching them once the listing is complete"""
+        listed = []
+        for file_info in files:
+            listed.append(file_info)
+            yield file_info
+        self._cache_listing(path, listed, stamp)
+
+    def _iter_entries(self, entries, path: str) -> Iterator[FileInfo]:
+        """Yield FileInfo objects for supported entries of a directory scan"""
+        # Entry paths are built by concatenation, the same as os.path.join
+        base = path if not path or path.endswith("/") else path + "/"
+        try:
+            with entries:
+                for entry in entries:
+                    try:
+                        # Skip hidden files and system directories
+                        if entry.name.startswith("."):
+                            continue
+                            
+                        file_type = self._get_file_type(entry)
                         
-                    # Get file info
-                    stat = entry.stat()
-                    files.append(
-                        FileInfo(
+                        # For files (not folders), only include media files
+                        if file_type != FileType.FOLDER and file_type == FileType.OTHER:
+                            continue
+                            
+                        # Get file info
+                        stat = entry.stat()
+                        yield FileInfo(
                             name=entry.name,
-                            path=os.path.join(path, entry.name),
+                            path=base + entry.name,
                             type=file_type,
                             size=stat.st_size if file_type != FileType.FOLDER else None,
                             modified_date=datetime.fromtimestamp(stat.st_mtime)
                         )
-                    )
-                except (OSError, ValueError) as e:
-                    print(f"Warning: Failed to read {entry.name}: {e}")
-                    continue
-                    
-            return files
-            
-        except Exception as e:
+                    except (OSError, ValueError) as e:
+                        print(f"Warning: Failed to read {entry.name}: {e}")
+                        continue
+        except OSError as e:
             raise FileSystemError(f"Failed to list files: {str(e)}")
 
+    def count_files(self, path: str) -> int:
+        """
+        Count the entries iter_files would yield for a directory
+
+        Entries are filtered by name only, without reading their metadata,
+        so this is much cheaper than listing the directory.
+
+        Args:
+            path: Directory path to count
+
+        Returns:
+            Number of supported files and subdirectories
+
+        Raises:
+            FileSystemError: If path is invalid or inaccessible
+        """
+        try:
+            self._verify_path_safety(path)
+
+            listing = self._get_cached_listing(path)
+            if listing is not None:
+                return len(listing)
+
+            abs_path = os.path.join(self.mount_point, path.lstrip("/"))
+            with os.scandir(abs_path) as entries:
+                return sum(
+                    1
+                    for entry in entries
+                    if not entry.name.startswith(".")
+                    and self._get_file_type(entry) != FileType.OTHER
+                )
+        except Exception as e:
+            raise FileSystemError(f"Failed to count files: {str(e)}")
+
+    def list_files(self, path: str) -> List[FileInfo]:
+        """
+        List files in a directory
+
+        The listing is cached so later calls, and get_file_info on its
+        entries, don't have to go back to the device as long as the
+        directory's mtime and size are unchanged.
+        
+        Args:
+            path: Directory path to list
+            
+        Returns:
+            List of FileInfo objects for files and subdirectories
+            
+        Raises:
+            FileSystemError: If path is invalid or inaccessible
+        """
+        return list(self._iter_files(path, cache=True))
+
     def get_file_info(self, path: str) -> FileInfo:
         """
         Get information about a file or directory
@@ -178,25 +374,40 @@ class FileSystem:
         try:
             # Verify path safety
             self._verify_path_safety(path)
+
+            # Use the parent directory's cached listing if there is one
+            parent, name = os.path.split(path.rstrip("/"))
+            listing = self._get_cached_listing(parent)
+            if listing is not None:
+                file_info = listing.get(name)
+                if file_info is not None and file_info.path == path:
+                    return file_info
             
             # Get absolute path
             abs_path = os.path.join(self.mount_point, path.lstrip("/"))
-            if not os.path.exists(abs_path):
+
+            # A single stat answers existence, type, size and mtime
+            try:
+                stat = os.stat(abs_path)
+            except OSError:
                 raise FileSystemError(f"Path does not exist: {path}")
                 
             # Get file type
-            file_type = self._get_file_type(abs_path)
+            if S_ISDIR(stat.st_mode):
+                file_type = FileType.FOLDER
+            else:
+                file_type = self.EXTENSION_TYPES.get(
+                    self._get_extension(abs_path), FileType.OTHER
+                )
             
             # For files (not folders), verify it's a media file
-            if file_type != FileType.FOLDER:
-                if not self._is_media_file(abs_path):
-                    raise FileSystemError(
-                        f"File type not supported: {path}. "
-                        "Only media files (images, videos, recordings) are allowed."
-                    )
+            if file_type == FileType.OTHER:
+                raise FileSystemError(
+                    f"File type not supported: {path}. "
+                    "Only media files (images, videos, recordings) are allowed."
+                )
                     
             # Get file info
-            stat = os.stat(abs_path)
             return FileInfo(
                 name=os.path.basename(path),
                 path=path,
@@ -227,6 +438,7 @@ class FileSystem:
             
             # Create directory
             os.makedirs(abs_path, exist_ok=True)
+            self.invalidate_cache(path)
             
         except Exception as e:
             raise FileSystemError(f"Failed to create directory: {str(e)}")
@@ -247,22 +459,53 @@ class FileSystem:
             
             # Get absolute path
             abs_path = os.path.join(self.mount_point, path.lstrip("/"))
-            if not os.path.exists(abs_path):
+            try:
+                is_dir = S_ISDIR(os.stat(abs_path).st_mode)
+            except OSError:
                 raise FileSystemError(f"Path does not exist: {path}")
                 
             # For files, verify it's a media file
-            if os.path.isfile(abs_path):
-                if not self._is_media_file(abs_path):
-                    raise FileSystemError(
-                        "Only media files can be deleted. "
-                        "System and other files are protected."
-                    )
+            if not is_dir and not self._is_media_file(abs_path):
+                raise FileSystemError(
+                    "Only media files can be deleted. "
+                    "System and other files are protected."
+                )
                     
             # Delete file or directory
-            if os.path.isdir(abs_path):
+            if is_dir:
                 os.rmdir(abs_path)  # Only delete if empty
             else:
                 os.remove(abs_path)
+            self.invalidate_cache(path)
                 
         except Exception as e:
             raise FileSystemError(f"Failed to delete: {str(e)}")
+
+    async def list_files_async(self, path: str) -> List[FileInfo]:
+        """
+        List files in a directory without blocking the event loop
+
+        See list_files. The listing runs in a worker thread, so several
+        directories can be listed concurrently with asyncio.gather.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.list_files, path)
+
+    async def get_file_info_async(self, path: str) -> FileInfo:
+        """Get information about a file or directory in a worker thread"""
+        import asyncio
+
+        return await asyncio.to_thread(self.get_file_info, path)
+
+    async def create_directory_async(self, path: str):
+        """Create a new directory in a worker thread"""
+        import asyncio
+
+        await asyncio.to_thread(self.create_directory, path)
+
+    async def delete_file_async(self, path: str):
+        """Delete a file or empty directory in a worker thread"""
+        import asyncio
+
+        await asyncio.to_thread(self.delete_file, path)
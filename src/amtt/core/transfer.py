@@ -7,17 +7,17 @@ import hashlib
 import shutil
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum, auto
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, List, Generator
+from typing import Dict, Optional, List, Generator, Tuple
 import os
 import time
 
 from amtt.core.filesystem import FileInfo, FileType
 from amtt.core.batch import BatchConfig
 from amtt.core.transfer_log import TransferLogger, TransferLogEntry
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 
 class OrganizationStrategy(Enum):
@@ -29,7 +29,7 @@ class OrganizationStrategy(Enum):
     BY_TYPE_AND_DATE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferProgress:
     """Progress information for a file transfer"""
 
@@ -44,7 +44,7 @@ class TransferProgress:
     failed_files: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferResult:
     """Result of a file transfer operation"""
 
@@ -57,6 +57,39 @@ class TransferResult:
     failed_paths: List[str] = field(default_factory=list)
 
 
+# Size units, indexed by power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def format_size(size: int, sep: str = "") -> str:
+    """
+    Format size in bytes to human readable string
+
+    Args:
+        size: Size in bytes
+        sep: Separator between the number and the unit
+    """
+    # Each unit spans 10 bits, so the bit length picks the unit directly
+    index = (int(size).bit_length() - 1) // 10 if size > 0 else 0
+    index = min(index, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * index)):.1f}{sep}{_SIZE_UNITS[index]}"
+
+
+@lru_cache(maxsize=1024)
+def _date_parts(ordinal: int) -> Tuple[str, str, str]:
+    """Year, month and day directory names for a proleptic Gregorian ordinal"""
+    day = date.fromordinal(ordinal)
+    return str(day.year), f"{day.month:02d}", f"{day.day:02d}"
+
+
+def _advise(f, advice: int):
+    """Give the kernel an access pattern hint for a whole file"""
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, advice)
+    except OSError:
+        pass  # Hints are optional
+
+
 class TransferError(Exception):
     """Raised when file transfer operations fail"""
 
@@ -66,7 +99,19 @@ class TransferError(Exception):
 class TransferManager:
     """Manages file transfer operations"""
 
-    BUFFER_SIZE = 8192  # 8KB buffer size for file transfers
+    BUFFER_SIZE = 1024 * 1024  # 1MB buffer size for file transfers
+
+    # Number of files copied concurrently within a batch
+    MAX_WORKERS = 4
+
+    # Destination directory for each file type when organizing by type
+    TYPE_DIRS = {
+        FileType.IMAGE: "Images",
+        FileType.VIDEO: "Videos",
+        FileType.AUDIO: "Audio",
+        FileType.DOCUMENT: "Documents",
+        FileType.OTHER: "Other",
+    }
 
     def __init__(self, device, filesystem):
         """
@@ -80,24 +125,131 @@ class TransferManager:
         self._filesystem = filesystem
         self._logger = TransferLogger()
 
-    def _calculate_hash(self, file_path: Path) -> str:
+    @cached_property
+    def _executor(self):
+        """Thread pool shared by all transfers of this manager"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+
+    def _copy_file(
+        self, source_path: str, dest_path: str, delete_source: bool, size: int = 0
+    ):
+        """
+        Copy a single file from the device, optionally deleting the source
+
+        When the size is known the destination is preallocated, so the
+        filesystem can lay it out in one extent instead of growing it with
+        every write, and a copy shorter than it is treated as failed so the
+        source is never deleted after a short copy. Files that grew since
+        they were listed, like a video still being recorded, are copied
+        whole.
+
+        Args:
+            source_path: Path of the file relative to the device mount point
+            dest_path: Local destination path
+            delete_source: Whether to delete the source file after copying
+            size: Expected size of the file in bytes, 0 if unknown
+
+        Raises:
+            TransferError: If fewer bytes than expected were copied
+        """
+        source_full_path = os.path.join(self._device.mount_point, source_path.lstrip("/"))
+        with open(source_full_path, "rb") as src, open(dest_path, "wb") as dst:
+            if size and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(dst.fileno(), 0, size)
+                except OSError:
+                    pass  # Not supported by the destination filesystem
+            fadvise = hasattr(os, "posix_fadvise")
+            if fadvise:
+                _advise(src, os.POSIX_FADV_SEQUENTIAL)
+            copied = self._copy_contents(src, dst, size)
+            # Drop any preallocated space the source didn't fill
+            dst.truncate(copied)
+            # The source won't be read again, so don't let it push more
+            # useful pages out of the page cache. The destination's pages
+            # are still dirty here, where the hint would do nothing
+            if fadvise:
+                _advise(src, os.POSIX_FADV_DONTNEED)
+        if copied < size:
+            os.remove(dest_path)
+            raise TransferError(
+                f"Copied {copied} of {size} bytes of {source_path}"
+            )
+        shutil.copystat(source_full_path, dest_path)
+        
+        # Delete source file if requested
+        if delete_source:
+            try:
+                os.remove(source_full_path)
+                self._filesystem.invalidate_cache(source_path)
+            except Exception as e:
+                print(f"[yellow]Warning: Failed to delete source file {source_path}: {e}[/yellow]")
+
+    def _copy_contents(self, src, dst, size: int = 0) -> int:
         """
-        Calculate SHA-256 hash of a file
+        Copy the contents of an open file to another
+
+        Tries os.copy_file_range first, which lets the kernel copy (or
+        reflink) the data without it passing through user space, then
+        os.sendfile, and finally a buffered copy where neither is supported
+        for the pair of files. Some FUSE and virtual filesystems report
+        end of file to the kernel copies straight away, so when a non-empty
+        file is expected, copying nothing moves on to the next method.
+
+        Args:
+            src: Source file, positioned at its start
+            dst: Destination file, positioned at its start
+            size: Expected size of the file in bytes, 0 if unknown
+
+        Returns:
+            int: Number of bytes copied
+        """
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+
+        # Both calls read the source at an explicit offset and write at the
+        # destination's current position
+        if hasattr(os, "copy_file_range"):
+            copied = 0
+            try:
+                while count := os.copy_file_range(
+                    src_fd, dst_fd, self.BUFFER_SIZE, copied
+                ):
+                    copied += count
+                if copied or not size:
+                    return copied
+            except OSError:
+                if copied:
+                    raise
+
+        if hasattr(os, "sendfile"):
+            copied = 0
+            try:
+                while count := os.sendfile(dst_fd, src_fd, copied, self.BUFFER_SIZE):
+                    copied += count
+                if copied or not size:
+                    return copied
+            except OSError:
+                if copied:
+                    raise
+
+        shutil.copyfileobj(src, dst, self.BUFFER_SIZE)
+        return dst.tell()
+
+    def _calculate_hash(self, file_path: Path, algorithm: str = "sha256") -> str:
+        """
+        Calculate the hash of a file
 
         Args:
             file_path: Path to the file
+            algorithm: Name of a hashlib algorithm (SHA-256 by default)
 
         Returns:
             str: Hex digest of file hash
         """
-        sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
-            while True:
-                data = f.read(self.BUFFER_SIZE)
-                if not data:
-                    break
-                sha256.update(data)
-        return sha256.hexdigest()
+            return hashlib.file_digest(f, algorithm).hexdigest()
 
     def _get_organized_path(
         self, file_info: FileInfo, base_path: Path, strategy: OrganizationStrategy
@@ -122,22 +274,14 @@ class TransferManager:
             OrganizationStrategy.BY_TYPE,
             OrganizationStrategy.BY_TYPE_AND_DATE,
         ):
-            type_dirs = {
-                FileType.IMAGE: "Images",
-                FileType.VIDEO: "Videos",
-                FileType.AUDIO: "Audio",
-                FileType.DOCUMENT: "Documents",
-                FileType.OTHER: "Other",
-            }
-            parts.append(type_dirs.get(file_info.type, "Other"))
+            parts.append(self.TYPE_DIRS.get(file_info.type, "Other"))
 
         if strategy in (
             OrganizationStrategy.BY_DATE,
             OrganizationStrategy.BY_TYPE_AND_DATE,
         ):
             if file_info.modified_date:
-                date = file_info.modified_date
-                parts.extend([str(date.year), f"{date.month:02d}", f"{date.day:02d}"])
+                parts.extend(_date_parts(file_info.modified_date.toordinal()))
 
         return base_path.joinpath(*parts)
 
@@ -158,48 +302,53 @@ class TransferManager:
         if strategy == "skip":
             raise TransferError(f"Destination file already exists: {dest_path}")
 
-        # Rename strategy
+        # Rename strategy: read the directory once instead of probing each
+        # candidate name with a stat
+        existing = set(os.listdir(dest_path.parent))
+        stem = dest_path.stem
+        suffix = dest_path.suffix
         counter = 1
-        while True:
-            stem = dest_path.stem
-            suffix = dest_path.suffix
-            new_path = dest_path.with_name(f"{stem}_{counter}{suffix}")
-            if not new_path.exists():
-                return new_path
+        while f"{stem}_{counter}{suffix}" in existing:
             counter += 1
+        return dest_path.with_name(f"{stem}_{counter}{suffix}")
 
-    def _create_batches(self, files: List[str]) -> Generator[List[str], None, None]:
+    def _create_batches(
+        self, files: List[str], sizes: Dict[str, int]
+    ) -> Generator[Tuple[List[str], int], None, None]:
         """
         Create batches of files for transfer
         
         Args:
             files: List of file paths to transfer
+            sizes: File sizes by path; files without a size are skipped
             
         Yields:
-            List of file paths for each batch
+            Tuple of the file paths in each batch and their total size
         """
         current_batch = []
         current_batch_size = 0
+
+        # Read the limits once; the CLI may change them before a transfer
+        max_batch_size = BatchConfig.MAX_BATCH_SIZE
+        max_files = BatchConfig.MAX_FILES_PER_BATCH
         
         for file_path in files:
             try:
-                # Get file info
-                file_info = self._filesystem.get_file_info(file_path)
-                file_size = file_info.size or 0
+                file_size = sizes[file_path]
                 
                 # If this single file is larger than batch size, make it its own batch
-                if file_size > BatchConfig.MAX_BATCH_SIZE:
+                if file_size > max_batch_size:
                     if current_batch:
-                        yield current_batch
-                    yield [file_path]
+                        yield current_batch, current_batch_size
+                    yield [file_path], file_size
                     current_batch = []
                     current_batch_size = 0
                     continue
                 
                 # If adding this file would exceed batch limits, yield current batch
-                if (current_batch_size + file_size > BatchConfig.MAX_BATCH_SIZE or
-                    len(current_batch) >= BatchConfig.MAX_FILES_PER_BATCH):
-                    yield current_batch
+                if (current_batch_size + file_size > max_batch_size or
+                    len(current_batch) >= max_files):
+                    yield current_batch, current_batch_size
                     current_batch = []
                     current_batch_size = 0
                 
@@ -207,32 +356,21 @@ class TransferManager:
                 current_batch.append(file_path)
                 current_batch_size += file_size
                 
-            except Exception as e:
-                print(f"Warning: Failed to get info for {file_path}: {e}")
+            except KeyError:
+                print(f"Warning: Failed to get info for {file_path}")
                 continue
         
         # Yield any remaining files
         if current_batch:
-            yield current_batch
+            yield current_batch, current_batch_size
 
-    def _get_total_size(self, files: List[str]) -> int:
+    def _get_total_size(self, files: List[str], sizes: Dict[str, int]) -> int:
         """Calculate total size of files to transfer"""
-        total_size = 0
-        for file_path in files:
-            try:
-                file_info = self._filesystem.get_file_info(file_path)
-                total_size += file_info.size or 0
-            except Exception:
-                continue
-        return total_size
+        return sum(sizes.get(file_path, 0) for file_path in files)
 
     def _format_size(self, size: int) -> str:
         """Format size in bytes to human readable string"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024:
-                return f"{size:.1f}{unit}"
-            size /= 1024
-        return f"{size:.1f}TB"
+        return format_size(size)
 
     def transfer_files(
         self,
@@ -254,9 +392,18 @@ class TransferManager:
             TransferResult with transfer statistics
         """
         result = TransferResult()
+        # Durations use the monotonic clock, unaffected by wall clock changes
+        started = time.monotonic()
+
+        # Resolve the destination once rather than per file
+        destination_dir = os.path.expanduser(destination_dir)
+        dest_prefix = os.path.join(destination_dir, "")
+        created_dirs = set()
         
-        # Check if source paths exist and contain files
+        # Check if source paths exist and contain files, keeping the info
+        # looked up for each so batching and progress don't stat them again
         available_files = []
+        file_infos: Dict[str, FileInfo] = {}
         for source_path in source_paths:
             try:
                 # Check if path is a file or directory
@@ -268,12 +415,14 @@ class TransferManager:
                         for file_info in self._filesystem.list_files(source_path):
                             if file_info.type != FileType.FOLDER:  # Skip folders
                                 available_files.append(file_info.path)
+                                file_infos[file_info.path] = file_info
                     except Exception as e:
                         print(f"\n[yellow]Directory is empty or all files have been transferred: {source_path}[/yellow]")
                         continue
                 else:
                     # Single file
                     available_files.append(source_path)
+                    file_infos[source_path] = file_info
                     
             except Exception as e:
                 print(f"\n[red]Error accessing {source_path}: {str(e)}[/red]")
@@ -283,11 +432,11 @@ class TransferManager:
         if not available_files:
             print("\n[yellow]No files found to transfer in any of the source paths[/yellow]")
             result.completed_at = datetime.now()
-            result.duration = (result.completed_at - result.started_at).total_seconds()
+            result.duration = time.monotonic() - started
             
             # Log empty transfer
             self._logger.add_entry(TransferLogEntry(
-                timestamp=datetime.now().isoformat(),
+                timestamp=result.completed_at.isoformat(),
                 source_dir=source_paths[0] if source_paths else "",
                 destination_dir=destination_dir,
                 successful_files=[],
@@ -300,17 +449,16 @@ class TransferManager:
             
             return result
             
-        total_size = self._get_total_size(available_files)
+        sizes = {path: file_info.size or 0 for path, file_info in file_infos.items()}
+        total_size = self._get_total_size(available_files, sizes)
         print(f"\nFound {len(available_files)} files to transfer ({self._format_size(total_size)})")
         
         # Create batches
-        batches = list(self._create_batches(available_files))
+        batches = list(self._create_batches(available_files, sizes))
         total_batches = len(batches)
         
         # Process each batch
-        for batch_num, batch in enumerate(batches, 1):
-            batch_size = self._get_total_size(batch)
-            
+        for batch_num, (batch, batch_size) in enumerate(batches, 1):
             # Create progress message
             batch_info = (
                 f"Batch {batch_num}/{total_batches} "
@@ -318,75 +466,80 @@ class TransferManager:
             )
             print(f"\nProcessing {batch_info}")
             
-            # Process files in this batch
+            # Prepare destinations and start copying files in this batch.
+            # Progress lines are written once per batch rather than per file.
+            pending = []
+            copy_lines = []
             for file_num, source_path in enumerate(batch, 1):
                 try:
-                    # Get source file info
-                    file_info = self._filesystem.get_file_info(source_path)
-                    file_size = file_info.size or 0
+                    file_size = sizes[source_path]
                     
-                    # Create destination path
+                    # Create destination path, always under the destination
+                    # even for paths outside "Internal shared storage"
                     rel_path = source_path.replace("/Internal shared storage/", "", 1)
-                    dest_path = os.path.join(destination_dir, rel_path)
+                    dest_path = dest_prefix + rel_path.lstrip("/")
                     
                     # Ensure destination directory exists
-                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                    dest_dir = os.path.dirname(dest_path)
+                    if dest_dir not in created_dirs:
+                        os.makedirs(dest_dir, exist_ok=True)
+                        created_dirs.add(dest_dir)
                     
                     # Copy file
-                    print(
+                    copy_lines.append(
                         f"Copying {file_num}/{len(batch)}: "
                         f"{os.path.basename(source_path)} "
                         f"({self._format_size(file_size)})"
                     )
-                    
-                    try:
-                        source_full_path = os.path.join(self._device.mount_point, source_path.lstrip("/"))
-                        shutil.copy2(source_full_path, dest_path)
-                        
-                        # Delete source file if requested
-                        if delete_source:
-                            try:
-                                os.remove(source_full_path)
-                            except Exception as e:
-                                print(f"[yellow]Warning: Failed to delete source file {source_path}: {e}[/yellow]")
-                        
-                        # Update result
-                        result.successful_files.append(source_path)
-                        result.total_size += file_size
+                    future = self._executor.submit(
+                        self._copy_file, source_path, dest_path, delete_source, file_size
+                    )
+                    pending.append((source_path, file_size, future))
                         
-                    except Exception as e:
-                        print(f"[red]Error copying {source_path}: {e}[/red]")
-                        result.failed_files.append(source_path)
+                except Exception as e:
+                    copy_lines.append(f"[red]Error processing {source_path}: {e}[/red]")
+                    result.failed_files.append(source_path)
+            if copy_lines:
+                print("\n".join(copy_lines))
+            
+            # Collect results in batch order
+            for source_path, file_size, future in pending:
+                try:
+                    future.result()
+                    
+                    # Update result
+                    result.successful_files.append(source_path)
+                    result.total_size += file_size
                     
-                    # Update progress
-                    if progress_callback:
-                        progress_callback(TransferProgress(
-                            current_file=source_path,
-                            total_files=len(available_files),
-                            current_size=result.total_size,
-                            total_size=total_size,
-                            current_batch=batch_num,
-                            total_batches=total_batches,
-                            started_at=result.started_at,
-                            successful_files=result.successful_files,
-                            failed_files=result.failed_files
-                        ))
-                        
                 except Exception as e:
-                    print(f"[red]Error processing {source_path}: {e}[/red]")
+                    print(f"[red]Error copying {source_path}: {e}[/red]")
                     result.failed_files.append(source_path)
+                
+                # Update progress
+                if progress_callback:
+                    progress_callback(TransferProgress(
+                        current_file=source_path,
+                        total_files=len(available_files),
+                        current_size=result.total_size,
+                        total_size=total_size,
+                        current_batch=batch_num,
+                        total_batches=total_batches,
+                        started_at=result.started_at,
+                        successful_files=result.successful_files,
+                        failed_files=result.failed_files
+                    ))
             
             # Delay between batches (except for the last batch)
-            if batch_num < total_batches:
+            if batch_num < total_batches and BatchConfig.BATCH_DELAY > 0:
                 print(f"Waiting {BatchConfig.BATCH_DELAY}s before next batch...")
                 time.sleep(BatchConfig.BATCH_DELAY)
         
         result.completed_at = datetime.now()
-        result.duration = (result.completed_at - result.started_at).total_seconds()
+        result.duration = time.monotonic() - started
         
         # Log transfer result
         self._logger.add_entry(TransferLogEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=result.completed_at.isoformat(),
             source_dir=source_paths[0] if source_paths else "",
             destination_dir=destination_dir,
             successful_files=result.successful_files,
@@ -411,15 +564,13 @@ class TransferManager:
             print(
                 f"\n[red]Failed to transfer {len(result.failed_files)} files:"
             )
-            for file in result.failed_files:
-                print(f"  - {file}")
+            print("\n".join(f"  - {file}" for file in result.failed_files))
                 
         if result.failed_paths:
             print(
                 f"\n[red]Failed to access {len(result.failed_paths)} paths:"
             )
-            for path in result.failed_paths:
-                print(f"  - {path}")
+            print("\n".join(f"  - {path}" for path in result.failed_paths))
                 
         if result.duration > 0:
             print(f"\nTransfer completed in {result.duration:.1f} seconds")
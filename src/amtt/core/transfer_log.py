@@ -3,12 +3,27 @@ Transfer logging module for Android Media Transfer Tool.
 Handles logging of file transfer operations.
 """
 
-import json
+import functools
+import gzip
 import os
-from dataclasses import asdict, dataclass
+import shutil
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import msgpack
+import orjson
+
+# Log files hold a stream of msgpack records, one per transfer
+LOG_EXTENSION = ".mp"
+# Logs of past days are gzip-compressed when a new day's log is started
+COMPRESSED_LOG_EXTENSION = ".mp.gz"
+# Older versions wrote a single JSON array per day
+LEGACY_LOG_EXTENSION = ".json"
+# All log file extensions, oldest format first
+LOG_EXTENSIONS = (LEGACY_LOG_EXTENSION, COMPRESSED_LOG_EXTENSION, LOG_EXTENSION)
+LOG_PREFIX = "transfer_log_"
 
 @dataclass
 class TransferLogEntry:
@@ -23,6 +38,28 @@ class TransferLogEntry:
     duration: float
     delete_source: bool
 
+# Field names of a log entry, in declaration order
+_ENTRY_FIELDS = tuple(f.name for f in fields(TransferLogEntry))
+
+@functools.lru_cache(maxsize=32)
+def _read_log_file(path: str, mtime_ns: int, size: int) -> Tuple[TransferLogEntry, ...]:
+    """
+    Parse a log file into entries
+
+    Results are cached, keyed on the file's modification time and size so
+    that a changed file is parsed again.
+    """
+    try:
+        opener = gzip.open if path.endswith(COMPRESSED_LOG_EXTENSION) else open
+        with opener(path, 'rb') as f:
+            if path.endswith(LEGACY_LOG_EXTENSION):
+                records = orjson.loads(f.read())
+            else:
+                records = msgpack.Unpacker(f, raw=False)
+            return tuple(TransferLogEntry(**record) for record in records)
+    except (ValueError, TypeError, EOFError, OSError, msgpack.UnpackException):
+        return ()
+
 class TransferLogger:
     """Manages transfer operation logging"""
 
@@ -40,39 +77,27 @@ class TransferLogger:
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
-    def _get_log_file(self) -> Path:
-        """Get the log file path for the current date"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        return self.log_dir / f"transfer_log_{today}.json"
-        
-    def _load_logs(self) -> List[dict]:
-        """Load existing logs for the current day"""
-        log_file = self._get_log_file()
-        if log_file.exists():
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return []
-        return []
-        
-    def _save_logs(self, logs: List[dict]):
-        """Save logs to file"""
-        log_file = self._get_log_file()
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(logs, f, indent=2, ensure_ascii=False)
+    def _get_log_file(self, date: Optional[str] = None) -> Path:
+        """Get the log file path for a date (default: today)"""
+        if date is None:
+            date = datetime.now().strftime("%Y-%m-%d")
+        return self.log_dir / f"{LOG_PREFIX}{date}{LOG_EXTENSION}"
             
     def add_entry(self, entry: TransferLogEntry):
-        """Add a new transfer log entry"""
-        # Load existing logs
-        logs = self._load_logs()
-        
-        # Convert entry to dict and add to logs
-        entry_dict = asdict(entry)
-        logs.append(entry_dict)
-        
-        # Save updated logs
-        self._save_logs(logs)
+        """
+        Add a new transfer log entry
+
+        The entry is appended as a single msgpack record, so existing
+        entries are never re-read or rewritten. The first entry of a day
+        compresses the logs of earlier days.
+        """
+        log_file = self._get_log_file()
+        if not log_file.exists():
+            self.compress_old_logs()
+        with open(log_file, 'ab') as f:
+            # A shallow mapping; asdict would deep-copy the file lists
+            record = {name: getattr(entry, name) for name in _ENTRY_FIELDS}
+            f.write(msgpack.packb(record, use_bin_type=True))
         
     def get_entries(self, date: Optional[str] = None) -> List[TransferLogEntry]:
         """
@@ -86,26 +111,73 @@ class TransferLogger:
         """
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
-            
-        log_file = self.log_dir / f"transfer_log_{date}.json"
-        if not log_file.exists():
-            return []
-            
-        try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-                return [TransferLogEntry(**entry) for entry in logs]
-        except (json.JSONDecodeError, KeyError):
-            return []
+
+        entries = []
+        for extension in LOG_EXTENSIONS:
+            log_file = self.log_dir / f"{LOG_PREFIX}{date}{extension}"
+            try:
+                stat = log_file.stat()
+            except FileNotFoundError:
+                continue
+            entries.extend(
+                _read_log_file(str(log_file), stat.st_mtime_ns, stat.st_size)
+            )
+        return entries
             
     def get_log_dates(self) -> List[str]:
         """Get list of dates that have transfer logs"""
-        log_files = self.log_dir.glob("transfer_log_*.json")
-        dates = []
-        for log_file in log_files:
-            try:
-                date = log_file.stem.split("_")[-1]
-                dates.append(date)
-            except IndexError:
+        dates = set()
+        for log_file in self.log_dir.glob(f"{LOG_PREFIX}*"):
+            name = log_file.name[len(LOG_PREFIX):]
+            for extension in LOG_EXTENSIONS:
+                if name.endswith(extension):
+                    dates.add(name[:-len(extension)])
+                    break
+        return sorted(dates)
+
+    def compress_old_logs(self):
+        """
+        Gzip the logs of days before today
+
+        Logs repeat the same directory prefixes in every path, so they
+        compress well. Each log is first claimed by renaming it, so that of
+        several processes rolling over at once only one compresses it, and
+        entries added meanwhile go to a new log for the next rollover. If a
+        compressed log for the date already exists the log is added to it as
+        another gzip member.
+        """
+        current = self._get_log_file()
+        for log_file in self.log_dir.glob(f"{LOG_PREFIX}*{LOG_EXTENSION}"):
+            if log_file == current:
                 continue
-        return sorted(dates) 
\ No newline at end of file
+            claimed = log_file.with_name(f"{log_file.name}.{os.getpid()}")
+            try:
+                os.rename(log_file, claimed)
+            except FileNotFoundError:
+                continue  # Claimed by another process
+            compressed = log_file.with_name(
+                log_file.name[:-len(LOG_EXTENSION)] + COMPRESSED_LOG_EXTENSION
+            )
+            tmp_file = compressed.with_name(
+                f"{compressed.name}.{os.getpid()}.tmp"
+            )
+            try:
+                with open(tmp_file, 'wb') as out:
+                    if compressed.exists():
+                        with open(compressed, 'rb') as existing:
+                            shutil.copyfileobj(existing, out)
+                    with open(claimed, 'rb') as src, gzip.GzipFile(
+                        fileobj=out, mode='wb'
+                    ) as dst:
+                        shutil.copyfileobj(src, dst)
+                os.replace(tmp_file, compressed)
+                claimed.unlink()
+            except OSError:
+                tmp_file.unlink(missing_ok=True)
+                # Hand the entries back for the next rollover to retry
+                try:
+                    with open(claimed, 'rb') as src, open(log_file, 'ab') as dst:
+                        shutil.copyfileobj(src, dst)
+                    claimed.unlink()
+                except OSError:
+                    pass
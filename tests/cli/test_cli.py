@@ -5,14 +5,16 @@ from unittest.mock import ANY, Mock, patch
 import pytest
 from click.testing import CliRunner
 
-from amtt.cli.commands import cli, format_progress, format_size
+from amtt.cli.commands import cli, format_minute, format_progress, format_size
 from amtt.core.device import Device, StorageInfo
 from amtt.core.filesystem import FileInfo, FileSystem, FileType
 from amtt.core.transfer import TransferManager, TransferProgress, TransferResult
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
+    # Tests that expect success pass catch_exceptions=False, so an
+    # unexpected error fails with its own traceback
     return CliRunner()
 
 
@@ -22,8 +24,10 @@ def mock_device_manager():
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_device():
+    # Building a spec'd Mock introspects the whole class, so the device is
+    # shared by the module and reset after each test instead
     device = Mock(spec=Device)
     device.name = "Test Device"
     device.serial = "123456789"
@@ -34,10 +38,26 @@ def mock_device():
     return device
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_device(mock_device):
+    yield
+    for mock in (mock_device, mock_device.filesystem, mock_device.transfer_manager):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(autouse=True)
+def mock_get_device(mock_device):
+    """Patch the current device lookup once for every test"""
+    with patch(
+        "amtt.cli.commands.get_current_device", return_value=mock_device
+    ) as mock:
+        yield mock
+
+
 def test_connect_command_success(runner, mock_device_manager, mock_device):
     mock_device_manager.return_value.get_connected_devices.return_value = [mock_device]
 
-    result = runner.invoke(cli, ["connect"])
+    result = runner.invoke(cli, ["connect"], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert "Connected to Test Device" in result.output
@@ -53,78 +73,101 @@ def test_connect_command_no_devices(runner, mock_device_manager):
     assert "No devices found" in result.output
 
 
-def test_list_command(runner, mock_device_manager, mock_device):
+def test_list_command(runner, mock_device):
     # Mock filesystem
     files = [
         FileInfo("photo.jpg", "/DCIM/photo.jpg", FileType.IMAGE, 1024),
         FileInfo("video.mp4", "/DCIM/video.mp4", FileType.VIDEO, 2048),
     ]
 
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.list_files.return_value = files
+    mock_device.filesystem.iter_files.return_value = iter(files)
 
-        result = runner.invoke(cli, ["list", "/DCIM"])
+    result = runner.invoke(cli, ["list", "/DCIM"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert "photo.jpg" in result.output
+    assert "video.mp4" in result.output
+    assert "1.0 KB" in result.output
+    assert "2.0 KB" in result.output
 
-        assert result.exit_code == 0
-        assert "photo.jpg" in result.output
-        assert "video.mp4" in result.output
-        assert "1.0 KB" in result.output
-        assert "2.0 KB" in result.output
 
+def test_list_command_plain_output(runner, mock_device):
+    files = [FileInfo("photo.jpg", "/DCIM/photo.jpg", FileType.IMAGE, 1024)]
 
-def test_list_command_empty(runner, mock_device_manager, mock_device):
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.list_files.return_value = []
+    mock_device.filesystem.iter_files.return_value = iter(files)
 
-        result = runner.invoke(cli, ["list", "/empty"])
+    result = runner.invoke(cli, ["list", "/DCIM"], catch_exceptions=False)
+
+    # Output is not a terminal, so rows are written as tab-separated lines
+    assert result.exit_code == 0
+    assert "photo.jpg\t1.0 KB" in result.output
 
-        assert result.exit_code == 0
-        assert "Directory is empty" in result.output
 
+def test_list_command_limit(runner, mock_device):
+    files = [
+        FileInfo(f"photo{i}.jpg", f"/DCIM/photo{i}.jpg", FileType.IMAGE, 1024 * i)
+        for i in range(1, 6)
+    ]
 
-def test_list_command_error(runner, mock_device_manager, mock_device):
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.list_files.side_effect = Exception("Access denied")
+    mock_device.filesystem.iter_files.return_value = iter(files)
 
-        result = runner.invoke(cli, ["list", "/error"])
+    result = runner.invoke(
+        cli,
+        ["list", "/DCIM", "--sort", "size", "--reverse", "--limit", "2"],
+        catch_exceptions=False,
+    )
 
-        assert result.exit_code != 0
-        assert "Failed to list files" in result.output
+    assert result.exit_code == 0
+    assert result.output.index("photo5.jpg") < result.output.index("photo4.jpg")
+    assert "photo3.jpg" not in result.output
 
 
-def test_transfer_command(runner, mock_device_manager, mock_device):
+def test_list_command_empty(runner, mock_device):
+    mock_device.filesystem.iter_files.return_value = iter([])
+
+    result = runner.invoke(cli, ["list", "/empty"], catch_exceptions=False)
+
+    assert result.exit_code == 0
+    assert "Directory is empty" in result.output
+
+
+def test_list_command_error(runner, mock_device):
+    mock_device.filesystem.iter_files.side_effect = Exception("Access denied")
+
+    result = runner.invoke(cli, ["list", "/error"])
+
+    assert result.exit_code != 0
+    assert "Failed to list files" in result.output
+
+
+def test_transfer_command(runner, mock_device):
     # Mock files and transfer
     file_info = FileInfo("photo.jpg", "/DCIM/photo.jpg", FileType.IMAGE, 1024)
     transfer_result = TransferResult(
         source=file_info, destination=Path("/dest/photo.jpg"), success=True
     )
 
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.get_file_info.return_value = file_info
-        mock_device.transfer_manager.transfer_file.return_value = transfer_result
-
-        result = runner.invoke(
-            cli, ["transfer", "/DCIM/photo.jpg", "/dest", "--verify"]
-        )
-
-        assert result.exit_code == 0
-        assert "Successfully transferred" in result.output
-        mock_device.transfer_manager.transfer_file.assert_called_with(
-            file_info,
-            Path("/dest"),
-            organization=ANY,
-            verify=True,
-            duplicate_strategy="rename",
-            progress_callback=ANY,
-            delete_source=False,
-        )
-
-
-def test_transfer_command_error(runner, mock_device_manager, mock_device):
+    mock_device.filesystem.get_file_info.return_value = file_info
+    mock_device.transfer_manager.transfer_file.return_value = transfer_result
+
+    result = runner.invoke(
+        cli, ["transfer", "/DCIM/photo.jpg", "/dest", "--verify"]
+    )
+
+    assert result.exit_code == 0
+    assert "Successfully transferred" in result.output
+    mock_device.transfer_manager.transfer_file.assert_called_with(
+        file_info,
+        Path("/dest"),
+        organization=ANY,
+        verify=True,
+        duplicate_strategy="rename",
+        progress_callback=ANY,
+        delete_source=False,
+    )
+
+
+def test_transfer_command_error(runner, mock_device):
     # Mock transfer error
     file_info = FileInfo("photo.jpg", "/DCIM/photo.jpg", FileType.IMAGE, 1024)
     transfer_result = TransferResult(
@@ -134,18 +177,16 @@ def test_transfer_command_error(runner, mock_device_manager, mock_device):
         error="Transfer failed",
     )
 
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.get_file_info.return_value = file_info
-        mock_device.transfer_manager.transfer_file.return_value = transfer_result
+    mock_device.filesystem.get_file_info.return_value = file_info
+    mock_device.transfer_manager.transfer_file.return_value = transfer_result
 
-        result = runner.invoke(cli, ["transfer", "/DCIM/photo.jpg", "/dest"])
+    result = runner.invoke(cli, ["transfer", "/DCIM/photo.jpg", "/dest"])
 
-        assert result.exit_code != 0
-        assert "Failed to transfer" in result.output
+    assert result.exit_code != 0
+    assert "Failed to transfer" in result.output
 
 
-def test_transfer_with_organization(runner, mock_device_manager, mock_device):
+def test_transfer_with_organization(runner, mock_device):
     file_info = FileInfo(
         "photo.jpg",
         "/DCIM/photo.jpg",
@@ -157,109 +198,100 @@ def test_transfer_with_organization(runner, mock_device_manager, mock_device):
         source=file_info, destination=Path("/dest/2024/03/20/photo.jpg"), success=True
     )
 
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.get_file_info.return_value = file_info
-        mock_device.transfer_manager.transfer_file.return_value = transfer_result
-
-        result = runner.invoke(
-            cli, ["transfer", "/DCIM/photo.jpg", "/dest", "--organize", "date"]
-        )
-
-        assert result.exit_code == 0
-        assert "Successfully transferred" in result.output
-        mock_device.transfer_manager.transfer_file.assert_called_with(
-            file_info,
-            Path("/dest"),
-            organization=ANY,
-            verify=False,
-            duplicate_strategy="rename",
-            progress_callback=ANY,
-            delete_source=False,
-        )
-
-
-def test_transfer_with_delete(runner, mock_device_manager, mock_device):
+    mock_device.filesystem.get_file_info.return_value = file_info
+    mock_device.transfer_manager.transfer_file.return_value = transfer_result
+
+    result = runner.invoke(
+        cli, ["transfer", "/DCIM/photo.jpg", "/dest", "--organize", "date"]
+    )
+
+    assert result.exit_code == 0
+    assert "Successfully transferred" in result.output
+    mock_device.transfer_manager.transfer_file.assert_called_with(
+        file_info,
+        Path("/dest"),
+        organization=ANY,
+        verify=False,
+        duplicate_strategy="rename",
+        progress_callback=ANY,
+        delete_source=False,
+    )
+
+
+def test_transfer_with_delete(runner, mock_device):
     file_info = FileInfo("photo.jpg", "/DCIM/photo.jpg", FileType.IMAGE, 1024)
     transfer_result = TransferResult(
         source=file_info, destination=Path("/dest/photo.jpg"), success=True
     )
 
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.get_file_info.return_value = file_info
-        mock_device.transfer_manager.transfer_file.return_value = transfer_result
-
-        result = runner.invoke(
-            cli, ["transfer", "/DCIM/photo.jpg", "/dest", "--delete-source"]
-        )
-
-        assert result.exit_code == 0
-        assert "Successfully transferred" in result.output
-        mock_device.transfer_manager.transfer_file.assert_called_with(
-            file_info,
-            Path("/dest"),
-            organization=ANY,
-            verify=False,
-            duplicate_strategy="rename",
-            progress_callback=ANY,
-            delete_source=True,
-        )
-
-
-def test_batch_transfer_command(runner, mock_device_manager, mock_device):
+    mock_device.filesystem.get_file_info.return_value = file_info
+    mock_device.transfer_manager.transfer_file.return_value = transfer_result
+
+    result = runner.invoke(
+        cli, ["transfer", "/DCIM/photo.jpg", "/dest", "--delete-source"]
+    )
+
+    assert result.exit_code == 0
+    assert "Successfully transferred" in result.output
+    mock_device.transfer_manager.transfer_file.assert_called_with(
+        file_info,
+        Path("/dest"),
+        organization=ANY,
+        verify=False,
+        duplicate_strategy="rename",
+        progress_callback=ANY,
+        delete_source=True,
+    )
+
+
+# Files matched by the batch transfer tests
+BATCH_FILES = tuple(
+    FileInfo(f"photo{i}.jpg", f"/DCIM/photo{i}.jpg", FileType.IMAGE, 1024)
+    for i in range(3)
+)
+
+
+def test_batch_transfer_command(runner, mock_device):
     # Mock multiple files
-    files = [
-        FileInfo(f"photo{i}.jpg", f"/DCIM/photo{i}.jpg", FileType.IMAGE, 1024)
-        for i in range(3)
-    ]
+    files = list(BATCH_FILES)
     transfer_results = [
         TransferResult(source=f, destination=Path(f"/dest/{f.name}"), success=True)
         for f in files
     ]
 
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.list_files.return_value = files
-        mock_device.transfer_manager.batch_transfer.return_value = transfer_results
+    mock_device.filesystem.list_files.return_value = files
+    mock_device.transfer_manager.batch_transfer.return_value = transfer_results
 
-        # Provide 'y' as input for the confirmation prompt
-        result = runner.invoke(
-            cli, ["transfer", "/DCIM/*.jpg", "/dest", "--batch"], input="y\n"
-        )
+    # Provide 'y' as input for the confirmation prompt
+    result = runner.invoke(
+        cli, ["transfer", "/DCIM/*.jpg", "/dest", "--batch"], input="y\n"
+    )
 
-        assert result.exit_code == 0
-        assert "Successfully transferred 3 files" in result.output
+    assert result.exit_code == 0
+    assert "Successfully transferred 3 files" in result.output
 
 
-def test_batch_transfer_no_matches(runner, mock_device_manager, mock_device):
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.list_files.return_value = []
+def test_batch_transfer_no_matches(runner, mock_device):
+    mock_device.filesystem.list_files.return_value = []
 
-        result = runner.invoke(cli, ["transfer", "/DCIM/*.jpg", "/dest", "--batch"])
+    result = runner.invoke(cli, ["transfer", "/DCIM/*.jpg", "/dest", "--batch"])
 
-        assert result.exit_code != 0
-        assert "No files match pattern" in result.output
+    assert result.exit_code != 0
+    assert "No files match pattern" in result.output
 
 
-def test_batch_transfer_cancelled(runner, mock_device_manager, mock_device):
-    files = [
-        FileInfo(f"photo{i}.jpg", f"/DCIM/photo{i}.jpg", FileType.IMAGE, 1024)
-        for i in range(3)
-    ]
+def test_batch_transfer_cancelled(runner, mock_device):
+    files = list(BATCH_FILES)
 
-    with patch("amtt.cli.commands.get_current_device") as mock_get_device:
-        mock_get_device.return_value = mock_device
-        mock_device.filesystem.list_files.return_value = files
+    mock_device.filesystem.list_files.return_value = files
 
-        # Provide 'n' as input to cancel the transfer
-        result = runner.invoke(
-            cli, ["transfer", "/DCIM/*.jpg", "/dest", "--batch"], input="n\n"
-        )
+    # Provide 'n' as input to cancel the transfer
+    result = runner.invoke(
+        cli, ["transfer", "/DCIM/*.jpg", "/dest", "--batch"], input="n\n"
+    )
 
-        assert result.exit_code == 0
-        assert not mock_device.transfer_manager.batch_transfer.called
+    assert result.exit_code == 0
+    assert not mock_device.transfer_manager.batch_transfer.called
 
 
 def test_connect_multiple_devices(runner, mock_device_manager):
@@ -286,13 +318,19 @@ def test_connect_multiple_devices(runner, mock_device_manager):
     assert "Connected to Device 1" in result.output
 
 
-def test_format_size():
+@pytest.mark.parametrize(
+    "size,expected",
+    [
+        (500, "500.0 B"),
+        (1024, "1.0 KB"),
+        (1024 * 1024, "1.0 MB"),
+        (1024 * 1024 * 1024, "1.0 GB"),
+        (1024 * 1024 * 1024 * 1024, "1.0 TB"),
+    ],
+)
+def test_format_size(size, expected):
     """Test size formatting function"""
-    assert format_size(500) == "500.0 B"
-    assert format_size(1024) == "1.0 KB"
-    assert format_size(1024 * 1024) == "1.0 MB"
-    assert format_size(1024 * 1024 * 1024) == "1.0 GB"
-    assert format_size(1024 * 1024 * 1024 * 1024) == "1.0 TB"
+    assert format_size(size) == expected
 
 
 def test_format_progress():
@@ -309,3 +347,10 @@ def test_format_progress():
     assert "test.jpg" in result
     assert "50.0%" in result
     assert "500.0 KB/1000.0 KB" in result  # Check the actual size format
+
+
+def test_format_minute():
+    """Test minute-precision timestamp formatting"""
+    assert format_minute(datetime(2024, 3, 20, 9, 5, 59)) == "2024-03-20 09:05"
+    assert format_minute(datetime(2024, 3, 20, 9, 5, 1)) == "2024-03-20 09:05"
+    assert format_minute(None) == ""
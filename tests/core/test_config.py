@@ -0,0 +1,106 @@
+import pytest
+
+from amtt.core.config import ConfigManager, DeviceConfig, PathConfig
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/Internal shared storage/DCIM/Camera",
+        "/Internal shared storage/DCIM/Camera/IMG_0001.jpg",
+        "Internal shared storage/Pictures/Holiday",
+        "\\Internal shared storage\\Music\\song.mp3",
+    ],
+)
+def test_is_safe_path_allows_media_directories(path):
+    assert ConfigManager.is_safe_path(path)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/",
+        "/Internal shared storage",
+        "/Internal shared storage/Android/data/com.app",
+        "/Internal shared storage/DCIM/Camera/.thumbnails",
+        "/Internal shared storage/Pictures/cache",
+        "/Internal shared storage/Download/lost.dir",
+    ],
+)
+def test_is_safe_path_rejects_other_paths(path):
+    assert not ConfigManager.is_safe_path(path)
+
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return ConfigManager()
+
+
+def test_batch_defers_config_write(config_manager):
+    device_id, _ = config_manager.get_device_config("123", "Pixel")
+    written = config_manager.config_file.read_text()
+
+    with config_manager.batch():
+        config_manager.add_path(
+            device_id, "/Internal shared storage/Music", "Music"
+        )
+        config_manager.set_friendly_name(device_id, "My Phone")
+        assert config_manager.config_file.read_text() == written
+
+    written = config_manager.config_file.read_text()
+    assert "/Internal shared storage/Music" in written
+    assert "My Phone" in written
+    assert list(config_manager.config_file.parent.glob("*.tmp")) == []
+
+
+def test_path_mutators_use_index(config_manager):
+    device_id, config = config_manager.get_device_config("123", "Pixel")
+    music = "/Internal shared storage/Music"
+
+    config_manager.add_path(device_id, music, "Music")
+    config_manager.add_path(device_id, music, "Duplicate")
+    config_manager.set_path_enabled(device_id, music, False)
+    config_manager.set_local_path(device_id, music, "~/Music")
+
+    path_config = config.paths_by_key[music]
+    assert config.paths[-1] is path_config
+    assert path_config.description == "Music"
+    assert not path_config.enabled
+    assert path_config.local_path == "~/Music"
+
+    config_manager.remove_path(device_id, music)
+    assert music not in config.paths_by_key
+    assert all(p.path != music for p in config.paths)
+
+    reloaded = ConfigManager().device_configs[device_id]
+    assert [p.path for p in reloaded.paths] == [p.path for p in config.paths]
+    assert reloaded.paths_by_key.keys() == config.paths_by_key.keys()
+
+
+def test_duplicate_paths_keep_first_match(config_manager):
+    music = "/Internal shared storage/Music"
+    first = PathConfig(music, "Music")
+    other = PathConfig("/Internal shared storage/Movies", "Movies")
+    duplicate = PathConfig(music, "Duplicate")
+    config = DeviceConfig("Pixel", "Pixel", [first, other, duplicate])
+    config_manager.device_configs["Pixel_123"] = config
+
+    config_manager.set_local_path("Pixel_123", music, "~/Music")
+    assert first.local_path == "~/Music"
+    assert duplicate.local_path != "~/Music"
+
+    config_manager.remove_path("Pixel_123", music)
+    assert config.paths == [other]
+
+
+def test_new_devices_get_own_default_paths(config_manager):
+    first_id, first = config_manager.get_device_config("1", "Pixel")
+    _, second = config_manager.get_device_config("2", "Pixel")
+    camera = ConfigManager.DEFAULT_PATHS[0].path
+
+    config_manager.set_path_enabled(first_id, camera, False)
+
+    assert not first.paths_by_key[camera].enabled
+    assert second.paths_by_key[camera].enabled
+    assert ConfigManager.DEFAULT_PATHS[0].enabled
@@ -1,3 +1,8 @@
+import os
+import subprocess
+import threading
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -16,6 +21,40 @@ def device_manager():
     return DeviceManager()
 
 
+@pytest.fixture
+def probes():
+    """
+    Patch the device probes to report the given devices
+
+    Each result is a list of device infos or a function returning one.
+    Devices are "created" as their device info.
+    """
+    with ExitStack() as stack:
+
+        def set_results(adb=(), gio=(), mount=()):
+            mocks = {}
+            for key, name, result in (
+                ("adb", "_try_adb_devices", adb),
+                ("gio", "_try_gio_mount", gio),
+                ("mount", "_try_find_mount_point", mount),
+            ):
+                if callable(result):
+                    kwargs = {"side_effect": result}
+                else:
+                    kwargs = {"return_value": list(result)}
+                mocks[key] = stack.enter_context(
+                    patch.object(DeviceManager, name, **kwargs)
+                )
+            mocks["create"] = stack.enter_context(
+                patch.object(
+                    DeviceManager, "_create_device", side_effect=lambda info: info
+                )
+            )
+            return SimpleNamespace(**mocks)
+
+        yield set_results
+
+
 def test_device_connection_success(mock_mtp, device_manager):
     # Mock device detection
     mock_device = Mock()
@@ -108,3 +147,296 @@ def test_device_manager_disconnect(mock_mtp):
     assert mock_mtp.disconnect.called
     assert not device_manager._connected_devices
     assert device_manager._mtp is None
+
+
+def test_get_connected_devices_merges_probes(device_manager, probes):
+    adb = {"name": "Pixel", "serial": "A1", "transport": "adb"}
+    gio = {"name": "Pixel", "serial": "A1", "transport": "mtp"}
+    mount = {"name": "Galaxy", "serial": "B2", "transport": "mtp"}
+    probes(adb=[adb], gio=[gio], mount=[mount])
+
+    assert device_manager.get_connected_devices() == [adb, mount]
+
+
+def test_try_adb_devices_skips_unreadable_devices(device_manager):
+    def run(args, **kwargs):
+        if args[1] == "devices":
+            stdout = (
+                "List of devices attached\n"
+                "A1 device usb:1 model:Pixel\n"
+                "B2 device usb:2\n"
+                "C3 unauthorized usb:3\n"
+            )
+            return Mock(stdout=stdout)
+        if args[2] == "B2":
+            raise subprocess.CalledProcessError(1, args)
+        return Mock(stdout="Pixel 8\n---AMTT---\nFilesystem 1K-blocks\n")
+
+    with patch("amtt.core.device.subprocess.run", side_effect=run):
+        devices = device_manager._try_adb_devices()
+
+    assert devices == [
+        {
+            "type": "adb",
+            "name": "Pixel 8",
+            "serial": "A1",
+            "transport": "adb",
+            "df_output": "Filesystem 1K-blocks\n",
+        }
+    ]
+
+
+def test_get_connected_devices_reuses_recent_scan(device_manager, probes):
+    info = {"name": "Pixel", "serial": "A1", "transport": "adb"}
+    adb = probes(adb=[info]).adb
+
+    first = device_manager.get_connected_devices()
+    assert device_manager.get_connected_devices() is first
+    assert adb.call_count == 1
+
+    device_manager.get_connected_devices(force=True)
+    assert adb.call_count == 2
+
+    device_manager.disconnect_all()
+    device_manager.get_connected_devices()
+    assert adb.call_count == 3
+
+
+def test_hotplug_event_clears_scan_cache(device_manager, probes):
+    info = {"name": "Pixel", "serial": "A1", "transport": "adb"}
+    adb = probes(adb=[info]).adb
+    device_manager._hotplug_observer = Mock()
+
+    with patch("amtt.core.device.time.monotonic", return_value=0.0) as monotonic:
+        device_manager.get_connected_devices()
+        monotonic.return_value = 30.0
+        device_manager.get_connected_devices()
+        assert adb.call_count == 1
+
+        device_manager._on_hotplug(Mock())
+        device_manager.get_connected_devices()
+        assert adb.call_count == 2
+
+
+def test_scan_cache_expires_while_watching_hotplug(device_manager, probes):
+    info = {"name": "Pixel", "serial": "A1", "transport": "adb"}
+    adb = probes(adb=[info]).adb
+    device_manager._hotplug_observer = Mock()
+
+    with patch("amtt.core.device.time.monotonic", return_value=0.0) as monotonic:
+        device_manager.get_connected_devices()
+        monotonic.return_value = DeviceManager.HOTPLUG_SCAN_CACHE_TTL
+        device_manager.get_connected_devices()
+        assert adb.call_count == 2
+
+
+def test_create_device_reads_mounted_storage_in_bytes(device_manager, tmp_path):
+    info = {"name": "Pixel", "serial": "A1", "transport": "mtp"}
+    df = Mock(
+        stdout=(
+            "Filesystem 1B-blocks Used Available Use% Mounted on\n"
+            "gvfsd-fuse 1073741824 0 1073741824 0% /run/user/1000/gvfs\n"
+            "gvfsd-fuse - - - - /run/user/1000/gvfs\n"
+        )
+    )
+
+    with patch.object(DeviceManager, "_get_mount_point", return_value=tmp_path), \
+            patch("amtt.core.device.subprocess.run", return_value=df) as run, \
+            patch("amtt.core.device.Device") as device_cls:
+        device_manager._create_device(info)
+
+    assert run.call_args.args[0] == ["df", "-B1", str(tmp_path)]
+    storage_info = device_cls.call_args.kwargs["storage_info"]
+    assert [s.capacity for s in storage_info] == [1073741824, 0]
+
+
+@pytest.mark.parametrize(
+    "name, serial, expected",
+    [
+        ("mtp:host=Xiaomi_Mi_11_6b38b99f", "6b38b99f", "Xiaomi_Mi_11"),
+        ("Mi 11 Lite 5G", "6b38b99f", "Mi 11 Lite 5G"),
+        ("mtp: host= Pixel_ABC", "ABC", "Pixel"),
+        ("6b38b99f Pixel", "6b38b99f", "Pixel"),
+        ("mtp:host=ABC_Pixel_8", "ABC", "Pixel_8"),
+        ("mtp:host=Pixel_8", None, "Pixel_8"),
+    ],
+)
+def test_clean_name(device_manager, name, serial, expected):
+    assert device_manager._clean_name(name, serial) == expected
+
+
+def test_try_gio_mount_parses_mtp_volumes(device_manager):
+    stdout = (
+        "Drive(0): Samsung SSD\n"
+        "  Type: GProxyDrive (GProxyVolumeMonitorUDisks2)\n"
+        "Volume(0): Mi 11 Lite 5G\n"
+        "  Type: GProxyVolume (GProxyVolumeMonitorMTP)\n"
+        "  Mount(0): Mi 11 Lite 5G -> mtp://Xiaomi_Mi_11_Lite_5G_6b38b99f/\n"
+        "    Type: GProxyShadowMount (GProxyVolumeMonitorMTP)\n"
+        "Volume(1): USB Stick\n"
+        "  Type: GProxyVolume (GProxyVolumeMonitorUDisks2)\n"
+        "  Mount(1): USB Stick -> file:///media/usb\n"
+        "\n"
+        "Volume(2): Pixel 8\n"
+        "  Type: GProxyVolume (GProxyVolumeMonitorMTP)\n"
+        "  Mount(2): Pixel 8 -> mtp://Google_Pixel_8_ABC123/\n"
+    )
+
+    with patch("amtt.core.device.subprocess.run", return_value=Mock(stdout=stdout)):
+        devices = device_manager._try_gio_mount()
+
+    assert devices == [
+        {
+            "type": "mtp",
+            "name": "Mi 11 Lite 5G",
+            "mount_point": "mtp://Xiaomi_Mi_11_Lite_5G_6b38b99f/",
+            "serial": "Xiaomi_Mi_11_Lite_5G_6b38b99f",
+            "transport": "mtp",
+        },
+        {
+            "type": "mtp",
+            "name": "Pixel 8",
+            "mount_point": "mtp://Google_Pixel_8_ABC123/",
+            "serial": "Google_Pixel_8_ABC123",
+            "transport": "mtp",
+        },
+    ]
+
+
+def test_mount_points_are_listed_once_per_scan(device_manager, tmp_path):
+    (tmp_path / "mtp:host=Pixel_8_ABC123").mkdir()
+    (tmp_path / "Documents").mkdir()
+
+    device_manager._mount_bases = [str(tmp_path), str(tmp_path / "missing")]
+
+    with patch("amtt.core.device.os.scandir", wraps=os.scandir) as mock_scandir:
+        devices = device_manager._try_find_mount_point()
+        mount_point = device_manager._find_in_common_mount_points("ABC123")
+
+    assert [d["serial"] for d in devices] == ["Pixel_8_ABC123"]
+    assert mount_point == tmp_path / "mtp:host=Pixel_8_ABC123"
+    assert mock_scandir.call_count == 2
+
+
+def test_find_device_stops_at_first_match(device_manager, probes):
+    gio = {"name": "Pixel", "serial": "A1", "transport": "mtp"}
+    other = {"name": "Galaxy", "serial": "B2", "transport": "mtp"}
+    create = probes(gio=[other, gio]).create
+
+    assert device_manager.find_device("A1") is gio
+    create.assert_called_once_with(gio)
+
+    with pytest.raises(DeviceConnectionError):
+        device_manager.find_device("C3")
+
+
+def test_find_device_prefers_earlier_probe_over_faster_one(device_manager, probes):
+    gio_done = threading.Event()
+    gio = {"name": "Mi 11 Lite 5G", "serial": "6b38b99f", "transport": "mtp"}
+    mount = {
+        "name": "Xiaomi_Mi_11_Lite_5G_6b38b99f",
+        "serial": "6b38b99f",
+        "transport": "mtp",
+    }
+
+    def slow_gio():
+        gio_done.wait(1)
+        return [gio]
+
+    def fast_mount():
+        # Let the mount scan finish first with its own name for the device
+        try:
+            return [mount]
+        finally:
+            threading.Timer(0.05, gio_done.set).start()
+
+    probes(gio=slow_gio, mount=fast_mount)
+
+    assert device_manager.find_device("6b38b99f") is gio
+
+
+def test_find_device_runs_probes_on_daemon_threads(device_manager):
+    daemon = []
+
+    def probe():
+        daemon.append(threading.current_thread().daemon)
+        return []
+
+    with patch.object(DeviceManager, "_get_probes", return_value=(probe,)):
+        with pytest.raises(DeviceConnectionError):
+            device_manager.find_device("A1")
+
+    assert daemon == [True]
+
+
+def test_mount_listing_from_before_reset_is_not_kept(device_manager, tmp_path):
+    device_manager._mount_bases = [str(tmp_path)]
+    scandir = os.scandir
+
+    # A scan resets the listing while an earlier probe is still reading it
+    def reset_then_scandir(path):
+        device_manager._reset_mount_entries()
+        return scandir(path)
+
+    with patch("amtt.core.device.os.scandir", side_effect=reset_then_scandir):
+        assert device_manager._get_mount_entries() == []
+
+    assert device_manager._mount_entries is None
+
+
+def test_device_creates_managers_on_first_use(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    with patch("amtt.core.device.ConfigManager") as config_manager_cls:
+        config_manager_cls.return_value.get_device_config.return_value = (
+            "Pixel_A1",
+            Mock(friendly_name="My Pixel"),
+        )
+        device = Device(
+            name="Pixel",
+            serial="A1",
+            storage_info=[StorageInfo(id=0, name="Storage 1", capacity=1)],
+            mount_point=tmp_path,
+        )
+        config_manager_cls.assert_not_called()
+
+        assert device.friendly_name == "My Pixel"
+        assert device.device_id == "Pixel_A1"
+        assert device.transfer_manager._filesystem is device.filesystem
+        config_manager_cls.assert_called_once_with()
+
+
+def test_devices_share_config_manager(device_manager, tmp_path):
+    storage_info = [StorageInfo(id=0, name="Storage 1", capacity=1)]
+
+    with patch("amtt.core.device.ConfigManager") as config_manager_cls:
+        first = Device(
+            "Pixel", "A1", storage_info, tmp_path,
+            config_manager_factory=device_manager._get_config_manager,
+        )
+        second = Device(
+            "Galaxy", "B2", storage_info, tmp_path,
+            config_manager_factory=device_manager._get_config_manager,
+        )
+
+        assert first.config_manager is second.config_manager
+        config_manager_cls.assert_called_once_with()
+
+
+def test_get_mount_point_uses_first_existing_candidate(device_manager, tmp_path):
+    info = {
+        "name": "Pixel",
+        "serial": "A1",
+        "transport": "mtp",
+        "mount_point": "mtp://A1/",
+    }
+
+    with patch.object(DeviceManager, "_get_gio_mount_point", return_value=None), \
+            patch.object(
+                DeviceManager, "_find_in_common_mount_points", return_value=tmp_path
+            ) as find:
+        assert device_manager._get_mount_point(info) == tmp_path
+
+        find.return_value = tmp_path / "missing"
+        with pytest.raises(DeviceConnectionError):
+            device_manager._get_mount_point(info)
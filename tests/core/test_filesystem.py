@@ -1,5 +1,8 @@
+import asyncio
+import os
 from datetime import datetime
-from unittest.mock import Mock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -8,9 +11,13 @@ from amtt.core.filesystem import FileSystem, FileSystemError, FileType
 
 @pytest.fixture
 def mock_device():
-    device = Mock()
-    device._mtp_device = Mock()
-    return device
+    mtp_device = SimpleNamespace(
+        get_files_and_folders=Mock(),
+        get_file_info=Mock(),
+        create_folder=Mock(),
+        delete_object=Mock(),
+    )
+    return SimpleNamespace(mount_point=None, _mtp_device=mtp_device)
 
 
 @pytest.fixture
@@ -72,13 +79,14 @@ def test_file_type_detection(filesystem, mock_device):
     ]
 
     files = filesystem.list_files("/test")
-    file_types = {f.name: f.type for f in files}
 
-    assert file_types["test.jpg"] == FileType.IMAGE
-    assert file_types["test.mp4"] == FileType.VIDEO
-    assert file_types["test.mp3"] == FileType.AUDIO
-    assert file_types["test.txt"] == FileType.DOCUMENT
-    assert file_types["test.unknown"] == FileType.OTHER
+    assert {f.name: f.type for f in files} == {
+        "test.jpg": FileType.IMAGE,
+        "test.mp4": FileType.VIDEO,
+        "test.mp3": FileType.AUDIO,
+        "test.txt": FileType.DOCUMENT,
+        "test.unknown": FileType.OTHER,
+    }
 
 
 def test_get_file_info(filesystem, mock_device):
@@ -149,12 +157,13 @@ def test_file_type_detection_edge_cases(filesystem, mock_device):
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     ]
 
-    for mime_type in doc_types:
-        mock_device._mtp_device.get_files_and_folders.return_value = [
-            {"filename": "test.doc", "filetype": mime_type, "id": 1}
-        ]
-        files = filesystem.list_files("/test")
-        assert files[0].type == FileType.DOCUMENT
+    mock_device._mtp_device.get_files_and_folders.return_value = [
+        {"filename": f"test{i}.doc", "filetype": mime_type, "id": i + 1}
+        for i, mime_type in enumerate(doc_types)
+    ]
+    files = filesystem.list_files("/test")
+    assert len(files) == len(doc_types)
+    assert {f.type for f in files} == {FileType.DOCUMENT}
 
 
 def test_parse_file_info_invalid_date(filesystem, mock_device):
@@ -170,3 +179,163 @@ def test_parse_file_info_invalid_date(filesystem, mock_device):
 
     files = filesystem.list_files("/test")
     assert files[0].modified_date is None
+
+
+CAMERA_PATH = "/Internal shared storage/DCIM/Camera"
+
+
+@pytest.fixture
+def camera_dir(tmp_path):
+    """Camera folder of the device mounted at tmp_path"""
+    camera = tmp_path / "Internal shared storage" / "DCIM" / "Camera"
+    camera.mkdir(parents=True)
+    return camera
+
+
+@pytest.fixture
+def mounted_filesystem(tmp_path):
+    return FileSystem(Mock(mount_point=tmp_path))
+
+
+def test_iter_files_yields_media_entries(camera_dir, mounted_filesystem):
+    (camera_dir / "photo.jpg").write_bytes(b"x" * 10)
+    (camera_dir / "notes.bin").write_bytes(b"x")
+    (camera_dir / ".hidden.jpg").write_bytes(b"x")
+    (camera_dir / "Burst").mkdir()
+
+    files = mounted_filesystem.iter_files(CAMERA_PATH)
+
+    assert not isinstance(files, list)
+    file_types = {f.name: (f.type, f.size) for f in files}
+    assert file_types == {
+        "photo.jpg": (FileType.IMAGE, 10),
+        "Burst": (FileType.FOLDER, None),
+    }
+
+
+def test_iter_files_validates_path_eagerly(mounted_filesystem):
+    with pytest.raises(FileSystemError) as exc_info:
+        mounted_filesystem.iter_files(f"{CAMERA_PATH}/Missing")
+    assert "Path does not exist" in str(exc_info.value)
+
+
+def test_list_files_caches_listing(camera_dir, mounted_filesystem):
+    (camera_dir / "photo.jpg").write_bytes(b"x" * 10)
+    mounted_filesystem.list_files(CAMERA_PATH)
+
+    with patch("os.scandir") as mock_scandir:
+        files = mounted_filesystem.list_files(CAMERA_PATH)
+        file_info = mounted_filesystem.get_file_info(f"{CAMERA_PATH}/photo.jpg")
+
+    mock_scandir.assert_not_called()
+    assert [f.name for f in files] == ["photo.jpg"]
+    assert file_info.size == 10
+
+
+def test_listing_cache_revalidates_directory_mtime(camera_dir, mounted_filesystem):
+    (camera_dir / "photo.jpg").write_bytes(b"x")
+    mounted_filesystem.list_files(CAMERA_PATH)
+
+    # Added behind the FileSystem's back
+    (camera_dir / "clip.mp4").write_bytes(b"x")
+    os.utime(camera_dir, ns=(0, 0))
+
+    assert sorted(f.name for f in mounted_filesystem.list_files(CAMERA_PATH)) == [
+        "clip.mp4",
+        "photo.jpg",
+    ]
+    assert mounted_filesystem.count_files(CAMERA_PATH) == 2
+
+
+def test_listing_cache_revalidates_directory_size(camera_dir, mounted_filesystem):
+    (camera_dir / "photo.jpg").write_bytes(b"x")
+    with patch.object(mounted_filesystem, "_get_stamp", return_value=(1, 10)):
+        mounted_filesystem.list_files(CAMERA_PATH)
+
+    # Same mtime, as on storage with a coarse timestamp resolution
+    (camera_dir / "clip.mp4").write_bytes(b"x")
+    with patch.object(mounted_filesystem, "_get_stamp", return_value=(1, 20)):
+        assert mounted_filesystem.count_files(CAMERA_PATH) == 2
+
+
+def test_delete_file_invalidates_listing(camera_dir, mounted_filesystem):
+    (camera_dir / "photo.jpg").write_bytes(b"x")
+    mounted_filesystem.list_files(CAMERA_PATH)
+    mounted_filesystem.delete_file(f"{CAMERA_PATH}/photo.jpg")
+
+    assert mounted_filesystem.list_files(CAMERA_PATH) == []
+
+
+def test_delete_file_protects_non_media_files(camera_dir, mounted_filesystem):
+    (camera_dir / "notes.txt").write_bytes(b"x")
+
+    with patch("os.stat", wraps=os.stat) as mock_stat:
+        with pytest.raises(FileSystemError, match="Only media files"):
+            mounted_filesystem.delete_file(f"{CAMERA_PATH}/notes.txt")
+
+    assert mock_stat.call_count == 1
+    assert (camera_dir / "notes.txt").exists()
+
+
+def test_count_files_matches_listing(camera_dir, mounted_filesystem):
+    (camera_dir / "photo.jpg").write_bytes(b"x")
+    (camera_dir / "clip.mp4").write_bytes(b"x")
+    (camera_dir / "notes.bin").write_bytes(b"x")
+    (camera_dir / ".hidden.jpg").write_bytes(b"x")
+    (camera_dir / "Burst").mkdir()
+
+    assert mounted_filesystem.count_files(CAMERA_PATH) == 3
+    assert mounted_filesystem.count_files(CAMERA_PATH) == len(
+        mounted_filesystem.list_files(CAMERA_PATH)
+    )
+
+
+def test_async_methods_run_filesystem_calls(tmp_path, mounted_filesystem):
+    storage = tmp_path / "Internal shared storage"
+    for folder in ("Pictures", "Music"):
+        (storage / folder).mkdir(parents=True)
+    (storage / "Pictures" / "photo.jpg").write_bytes(b"x")
+    (storage / "Music" / "song.mp3").write_bytes(b"x")
+
+    async def main():
+        return await asyncio.gather(
+            mounted_filesystem.list_files_async("/Internal shared storage/Pictures"),
+            mounted_filesystem.list_files_async("/Internal shared storage/Music"),
+        )
+
+    pictures, music = asyncio.run(main())
+
+    assert [f.name for f in pictures] == ["photo.jpg"]
+    assert [f.name for f in music] == ["song.mp3"]
+
+
+def test_get_file_info_stats_uncached_path_once(camera_dir, mounted_filesystem):
+    (camera_dir / "photo.jpg").write_bytes(b"x" * 3)
+    (camera_dir / "notes.bin").write_bytes(b"x")
+
+    with patch("os.stat", wraps=os.stat) as mock_stat:
+        file_info = mounted_filesystem.get_file_info(f"{CAMERA_PATH}/photo.jpg")
+        folder_info = mounted_filesystem.get_file_info(CAMERA_PATH)
+
+    assert (file_info.type, file_info.size) == (FileType.IMAGE, 3)
+    assert (folder_info.type, folder_info.size) == (FileType.FOLDER, None)
+    assert mock_stat.call_count == 2
+
+    with pytest.raises(FileSystemError) as exc_info:
+        mounted_filesystem.get_file_info(f"{CAMERA_PATH}/notes.bin")
+    assert "File type not supported" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "photo.JPG",
+        "/DCIM/Camera/clip.mp4",
+        "/DCIM/v1.2/noext",
+        "archive.tar.gz",
+        "/a.b/.hidden",
+        "plain",
+    ],
+)
+def test_get_extension_matches_splitext(path):
+    assert FileSystem._get_extension(path) == os.path.splitext(path)[1].lower()
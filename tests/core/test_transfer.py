@@ -1,17 +1,24 @@
 import hashlib
+import os
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
+from amtt.core.batch import BatchConfig
 from amtt.core.filesystem import FileInfo, FileType
 from amtt.core.transfer import (
     OrganizationStrategy,
+    TransferError,
     TransferManager,
     TransferProgress,
 )
 
+# File content and its SHA-256 digest for the single file transfer test
+FILE_CONTENT = b"test file content"
+FILE_HASH = hashlib.sha256(FILE_CONTENT).hexdigest()
+
 
 @pytest.fixture
 def mock_device():
@@ -43,12 +50,8 @@ def test_transfer_single_file_success(
         id=1,
     )
 
-    # Mock file content and hash
-    file_content = b"test file content"
-    file_hash = hashlib.sha256(file_content).hexdigest()
-
     # Setup mocks
-    mock_device._mtp_device.get_file_content.return_value = file_content
+    mock_device._mtp_device.get_file_content.return_value = FILE_CONTENT
 
     # Perform transfer
     dest_path = tmp_path / "photos"
@@ -58,10 +61,10 @@ def test_transfer_single_file_success(
     assert result.success
     assert result.destination == dest_path / "test.jpg"
     assert result.source == source_file
-    assert result.hash == file_hash
+    assert result.hash == FILE_HASH
 
     # Verify file was written correctly
-    assert (dest_path / "test.jpg").read_bytes() == file_content
+    assert (dest_path / "test.jpg").read_bytes() == FILE_CONTENT
 
 
 def test_transfer_with_organization(
@@ -183,20 +186,192 @@ def test_transfer_progress_callback(
     assert progress_updates[-1].bytes_transferred == 1024
 
 
-def test_organize_by_type(transfer_manager):
-    """Test organizing files by type"""
-    # Test different file types
-    file_types = [
+@pytest.mark.parametrize(
+    "file_type,filename,expected_dir",
+    [
         (FileType.IMAGE, "test.jpg", "Images"),
         (FileType.VIDEO, "test.mp4", "Videos"),
         (FileType.AUDIO, "test.mp3", "Audio"),
         (FileType.DOCUMENT, "test.pdf", "Documents"),
         (FileType.OTHER, "test.xyz", "Other"),
-    ]
+    ],
+)
+def test_organize_by_type(transfer_manager, file_type, filename, expected_dir):
+    """Test organizing files by type"""
+    file_info = FileInfo(filename, f"/DCIM/{filename}", file_type, 1024)
+    dest_path = transfer_manager._get_organized_path(
+        file_info, Path("/dest"), OrganizationStrategy.BY_TYPE
+    )
+    assert str(dest_path) == f"/dest/{expected_dir}"
 
-    for file_type, filename, expected_dir in file_types:
-        file_info = FileInfo(filename, f"/DCIM/{filename}", file_type, 1024)
-        dest_path = transfer_manager._get_organized_path(
-            file_info, Path("/dest"), OrganizationStrategy.BY_TYPE
-        )
-        assert str(dest_path) == f"/dest/{expected_dir}"
+
+def test_organize_by_type_and_date(transfer_manager):
+    file_info = FileInfo(
+        "test.jpg", "/DCIM/test.jpg", FileType.IMAGE, 1024,
+        modified_date=datetime(2024, 3, 5, 23, 59),
+    )
+
+    dest_path = transfer_manager._get_organized_path(
+        file_info, Path("/dest"), OrganizationStrategy.BY_TYPE_AND_DATE
+    )
+
+    assert dest_path == Path("/dest/Images/2024/03/05")
+
+
+def test_transfer_files_expands_destination(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    mount_point = tmp_path / "device"
+    camera = mount_point / "Internal shared storage" / "DCIM" / "Camera"
+    camera.mkdir(parents=True)
+    (camera / "a.jpg").write_bytes(b"a")
+    (camera / "b.jpg").write_bytes(b"b")
+
+    device = Mock(mount_point=mount_point)
+    filesystem = Mock()
+    filesystem.get_file_info.side_effect = lambda path: FileInfo(
+        name=path.rsplit("/", 1)[-1], path=path, type=FileType.IMAGE, size=1
+    )
+    manager = TransferManager(device, filesystem)
+
+    result = manager.transfer_files(
+        [
+            "/Internal shared storage/DCIM/Camera/a.jpg",
+            "/Internal shared storage/DCIM/Camera/b.jpg",
+        ],
+        "~/Downloads",
+        delete_source=False,
+    )
+
+    downloads = tmp_path / "home" / "Downloads" / "DCIM" / "Camera"
+    assert len(result.successful_files) == 2
+    assert (downloads / "a.jpg").read_bytes() == b"a"
+    assert (downloads / "b.jpg").read_bytes() == b"b"
+
+
+def test_transfer_files_keeps_batch_order_with_failures(tmp_path, capsys):
+    mount_point = tmp_path / "device"
+    camera = mount_point / "DCIM"
+    camera.mkdir(parents=True)
+    for name in ("a.jpg", "c.jpg"):
+        (camera / name).write_bytes(name[:1].encode())
+
+    device = Mock(mount_point=mount_point)
+    filesystem = Mock()
+    filesystem.get_file_info.side_effect = lambda path: FileInfo(
+        name=path.rsplit("/", 1)[-1], path=path, type=FileType.IMAGE, size=1
+    )
+    manager = TransferManager(device, filesystem)
+    files = ["/DCIM/a.jpg", "/DCIM/b.jpg", "/DCIM/c.jpg"]
+
+    result = manager.transfer_files(files, str(tmp_path / "out"), delete_source=False)
+
+    assert result.successful_files == ["/DCIM/a.jpg", "/DCIM/c.jpg"]
+    assert result.failed_files == ["/DCIM/b.jpg"]
+    assert result.total_size == 2
+    copied = sorted(p.name for p in (tmp_path / "out" / "DCIM").iterdir())
+    assert copied == ["a.jpg", "c.jpg"]
+    output = capsys.readouterr().out
+    assert (
+        "Copying 1/3: a.jpg (1.0B)\n"
+        "Copying 2/3: b.jpg (1.0B)\n"
+        "Copying 3/3: c.jpg (1.0B)"
+    ) in output
+    assert "  - /DCIM/b.jpg" in output
+    # Sizes come from the lookups that found the files
+    assert filesystem.get_file_info.call_count == 3
+
+
+def test_calculate_hash(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"amtt")
+    manager = TransferManager(Mock(), Mock())
+
+    assert manager._calculate_hash(path) == hashlib.sha256(b"amtt").hexdigest()
+    blake2b = hashlib.blake2b(b"amtt").hexdigest()
+    assert manager._calculate_hash(path, "blake2b") == blake2b
+
+
+def test_handle_duplicate_renames_to_first_free_name(tmp_path):
+    for name in ("photo.jpg", "photo_1.jpg", "photo_2.jpg", "photo_4.jpg"):
+        (tmp_path / name).write_bytes(b"x")
+    manager = TransferManager(Mock(), Mock())
+
+    assert manager._handle_duplicate(tmp_path / "photo.jpg") == tmp_path / "photo_3.jpg"
+    assert manager._handle_duplicate(tmp_path / "clip.mp4") == tmp_path / "clip.mp4"
+    with pytest.raises(TransferError):
+        manager._handle_duplicate(tmp_path / "photo.jpg", "skip")
+
+
+def test_copy_file_keeps_source_after_short_copy(tmp_path):
+    (tmp_path / "photo.jpg").write_bytes(b"abc")
+    manager = TransferManager(Mock(mount_point=tmp_path), Mock())
+    dest = tmp_path / "copy.jpg"
+
+    # The size reported when listing is larger than what is read
+    with pytest.raises(TransferError):
+        manager._copy_file("/photo.jpg", str(dest), delete_source=True, size=4096)
+
+    assert (tmp_path / "photo.jpg").read_bytes() == b"abc"
+    assert not dest.exists()
+
+
+def test_copy_file_copies_files_that_grew_since_listing(tmp_path):
+    (tmp_path / "clip.mp4").write_bytes(b"abcdef")
+    manager = TransferManager(Mock(mount_point=tmp_path), Mock())
+    dest = tmp_path / "copy.mp4"
+
+    manager._copy_file("/clip.mp4", str(dest), delete_source=True, size=3)
+
+    assert dest.read_bytes() == b"abcdef"
+    assert not (tmp_path / "clip.mp4").exists()
+
+
+def test_copy_file_falls_back_when_kernel_copy_reads_nothing(tmp_path, monkeypatch):
+    (tmp_path / "photo.jpg").write_bytes(b"abc")
+    manager = TransferManager(Mock(mount_point=tmp_path), Mock())
+    dest = tmp_path / "copy.jpg"
+
+    # As on FUSE filesystems that report end of file to copy_file_range
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0)
+    manager._copy_file("/photo.jpg", str(dest), delete_source=True, size=3)
+
+    assert dest.read_bytes() == b"abc"
+    assert not (tmp_path / "photo.jpg").exists()
+
+
+@pytest.mark.parametrize(
+    "unsupported", [("copy_file_range",), ("copy_file_range", "sendfile")]
+)
+def test_copy_contents_falls_back(tmp_path, monkeypatch, unsupported):
+    source = tmp_path / "photo.jpg"
+    source.write_bytes(b"abc" * 1000)
+    manager = TransferManager(Mock(), Mock())
+
+    def fail(*args):
+        raise OSError("not supported")
+
+    for name in unsupported:
+        monkeypatch.setattr(os, name, fail)
+    with open(source, "rb") as src, open(tmp_path / "copy.jpg", "wb") as dst:
+        assert manager._copy_contents(src, dst) == 3000
+
+    assert (tmp_path / "copy.jpg").read_bytes() == source.read_bytes()
+
+
+def test_format_size(transfer_manager):
+    assert transfer_manager._format_size(0) == "0.0B"
+    assert transfer_manager._format_size(1023) == "1023.0B"
+    assert transfer_manager._format_size(1536) == "1.5KB"
+    assert transfer_manager._format_size(3 * 1024**3) == "3.0GB"
+    assert transfer_manager._format_size(2 * 1024**5) == "2.0PB"
+
+
+def test_create_batches_yields_batch_sizes(transfer_manager, monkeypatch):
+    monkeypatch.setattr(BatchConfig, "MAX_BATCH_SIZE", 100)
+    monkeypatch.setattr(BatchConfig, "MAX_FILES_PER_BATCH", 2)
+    sizes = {"a": 10, "b": 20, "c": 30, "big": 500}
+
+    files = ["a", "b", "c", "big", "missing"]
+    batches = list(transfer_manager._create_batches(files, sizes))
+
+    assert batches == [(["a", "b"], 30), (["c"], 30), (["big"], 500)]
@@ -0,0 +1,132 @@
+import gzip
+import json
+import os
+import shutil
+from dataclasses import asdict
+
+import msgpack
+import pytest
+
+from amtt.core.transfer_log import TransferLogEntry, TransferLogger
+
+
+@pytest.fixture
+def logger(tmp_path):
+    return TransferLogger(log_dir=str(tmp_path))
+
+
+def make_entry(timestamp="2024-03-20T10:00:00", files=("/DCIM/photo.jpg",)):
+    return TransferLogEntry(
+        timestamp=timestamp,
+        source_dir="/DCIM",
+        destination_dir="/backup",
+        successful_files=list(files),
+        failed_files=[],
+        failed_paths=[],
+        total_size=1024,
+        duration=1.5,
+        delete_source=False,
+    )
+
+
+def test_add_and_get_entries(logger):
+    first = make_entry()
+    second = make_entry(timestamp="2024-03-20T11:00:00")
+
+    logger.add_entry(first)
+    assert logger.get_entries() == [first]
+
+    # A new entry invalidates the cached parse of the log file
+    logger.add_entry(second)
+    assert logger.get_entries() == [first, second]
+
+
+def test_get_entries_reads_legacy_json_logs(logger, tmp_path):
+    legacy = make_entry()
+    (tmp_path / "transfer_log_2024-03-20.json").write_text(
+        json.dumps([asdict(legacy)])
+    )
+
+    assert logger.get_entries("2024-03-20") == [legacy]
+    assert logger.get_log_dates() == ["2024-03-20"]
+
+
+def test_get_entries_missing_date(logger):
+    assert logger.get_entries("1999-01-01") == []
+
+
+def set_today(monkeypatch, logger, today):
+    """Make the logger treat the given date as today"""
+    monkeypatch.setattr(
+        logger,
+        "_get_log_file",
+        lambda date=None: logger.log_dir / f"transfer_log_{date or today}.mp",
+    )
+
+
+def test_old_logs_are_compressed_on_rollover(logger, tmp_path, monkeypatch):
+    old = make_entry()
+    set_today(monkeypatch, logger, "2024-03-20")
+    logger.add_entry(old)
+
+    # The first entry of the next day compresses the previous day's log
+    new = make_entry(timestamp="2024-03-21T09:00:00")
+    set_today(monkeypatch, logger, "2024-03-21")
+    logger.add_entry(new)
+
+    assert not (tmp_path / "transfer_log_2024-03-20.mp").exists()
+    assert (tmp_path / "transfer_log_2024-03-20.mp.gz").exists()
+    assert logger.get_entries("2024-03-20") == [old]
+    assert logger.get_entries("2024-03-21") == [new]
+    assert logger.get_log_dates() == ["2024-03-20", "2024-03-21"]
+
+
+def test_compress_old_logs_appends_to_existing_archive(logger, monkeypatch):
+    first = make_entry()
+    second = make_entry(timestamp="2024-03-20T11:00:00")
+
+    for entry in (first, second):
+        set_today(monkeypatch, logger, "2024-03-20")
+        logger.add_entry(entry)
+        set_today(monkeypatch, logger, "2024-03-21")
+        logger.compress_old_logs()
+
+    assert logger.get_entries("2024-03-20") == [first, second]
+
+
+def test_entries_added_while_compressing_are_kept(logger, monkeypatch):
+    first = make_entry()
+    late = make_entry(timestamp="2024-03-20T23:59:59")
+    set_today(monkeypatch, logger, "2024-03-20")
+    logger.add_entry(first)
+    set_today(monkeypatch, logger, "2024-03-21")
+
+    # A process that started before midnight logs to yesterday's file
+    copyfileobj = shutil.copyfileobj
+
+    def copy_then_log(src, dst, *args):
+        copyfileobj(src, dst, *args)
+        if isinstance(dst, gzip.GzipFile):
+            with open(logger._get_log_file("2024-03-20"), "ab") as f:
+                f.write(msgpack.packb(asdict(late)))
+
+    monkeypatch.setattr(shutil, "copyfileobj", copy_then_log)
+    logger.compress_old_logs()
+
+    assert logger.get_entries("2024-03-20") == [first, late]
+
+
+def test_compress_old_logs_skips_claimed_logs(logger, tmp_path, monkeypatch):
+    set_today(monkeypatch, logger, "2024-03-20")
+    logger.add_entry(make_entry())
+    set_today(monkeypatch, logger, "2024-03-21")
+
+    # Another process renames the log away between listing and claiming it
+    def claimed_elsewhere(src, dst):
+        os.remove(src)
+        raise FileNotFoundError(src)
+
+    monkeypatch.setattr(os, "rename", claimed_elsewhere)
+    logger.compress_old_logs()
+
+    assert list(tmp_path.iterdir()) == []
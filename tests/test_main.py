@@ -1,13 +1,18 @@
-import runpy
+from pathlib import Path
 from unittest.mock import patch
 
+import amtt.__main__
+
+# Compiled once; executing it with __name__ set to "__main__" runs the
+# module's entry point without re-importing it
+_MAIN_CODE = compile(
+    Path(amtt.__main__.__file__).read_text(), amtt.__main__.__file__, "exec"
+)
+
 
 def test_main_entry_point():
     """Test the main entry point"""
-    with patch("amtt.cli.commands.cli") as mock_cli:
-        # Import the module
-        import amtt.__main__
-
+    with patch("amtt.__main__.cli") as mock_cli:
         # Call the main function directly
         amtt.__main__.cli()
 
@@ -19,7 +24,7 @@ def test_main_module_execution():
     """Test execution as __main__"""
     with patch("amtt.cli.commands.cli") as mock_cli:
         # Run the module as __main__
-        runpy.run_module("amtt.__main__", run_name="__main__")
+        exec(_MAIN_CODE, {"__name__": "__main__"})
 
         # Verify cli() was called
         mock_cli.assert_called_once()